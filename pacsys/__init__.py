@@ -838,6 +838,7 @@ def ssh(
     hops: "Union[str, SSHHop, list[str | SSHHop]]",
     auth: Optional[Auth] = None,
     connect_timeout: float = 10.0,
+    keepalive_interval: int = 30,
 ) -> "SSHClient":
     """Create an SSH client for remote command execution, tunneling, and SFTP.
 
@@ -850,6 +851,7 @@ def ssh(
         auth: Optional KerberosAuth for GSSAPI hops. If None and any hop uses
               gssapi auth, credentials are validated at construction time.
         connect_timeout: TCP connection timeout in seconds (default 10.0).
+        keepalive_interval: Seconds between SSH keepalives (default 30, 0 disables).
 
     Returns:
         SSHClient instance (use as context manager or call close() when done)
@@ -873,7 +875,7 @@ def ssh(
     """
     from pacsys.ssh import SSHClient as _SSHClient
 
-    return _SSHClient(hops=hops, auth=auth, connect_timeout=connect_timeout)
+    return _SSHClient(hops=hops, auth=auth, connect_timeout=connect_timeout, keepalive_interval=keepalive_interval)
 
 
 def supervised(
@@ -950,6 +952,7 @@ _LAZY_IMPORTS: dict[str, str] = {
     "SSHTimeoutError": "pacsys.ssh",
     # acl_session
     "ACLSession": "pacsys.acl_session",
+    "AsyncACLSession": "pacsys.acl_session",
     # devdb
     "DeviceInfoResult": "pacsys.devdb",
     "PropertyInfo": "pacsys.devdb",
@@ -1048,6 +1051,7 @@ __all__ = [
     "SSHTimeoutError",
     # ACL Session
     "ACLSession",
+    "AsyncACLSession",
     # DevDB result types
     "DeviceInfoResult",
     "PropertyInfo",
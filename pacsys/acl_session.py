@@ -10,16 +10,25 @@ Example:
     with ssh.acl_session() as acl:
         acl.send("read M:OUTTMP")
         acl.send("value = M:OUTTMP ; if (value > 100) set M:OUTTMP 100; endif")
+
+    # asyncio: many sessions on one event loop thread
+    async with ssh.async_acl_session() as acl:
+        await acl.send("read M:OUTTMP")
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+import time
 from typing import TYPE_CHECKING
 
 from pacsys.errors import ACLError
 
 if TYPE_CHECKING:
+    import paramiko
+
     from pacsys.ssh import SSHClient
 
 logger = logging.getLogger(__name__)
@@ -27,13 +36,31 @@ logger = logging.getLogger(__name__)
 # Real ACL prompt is "\nACL> " (newline before, space after).
 # Anchoring on \n prevents false matches in command output.
 _ACL_PROMPT = b"\nACL> "
+_ACL_PROMPT_LEN = len(_ACL_PROMPT)
+
+# Whole "ACL> <echoed command>" line, including its terminating newline.
+_ACL_PROMPT_LINE_RE = re.compile(r"^ACL>.*(?:\n|$)", re.MULTILINE)
+
+# Every line boundary str.splitlines() recognizes other than "\n" (e.g. pty CRLF).
+_OTHER_LINE_BREAKS_RE = re.compile("\r\n|[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
 
 
 def _strip_acl_output(text: str) -> str:
     """Strip ACL prompts and echoed commands from one-shot acl output."""
-    lines = text.splitlines()
-    out = [line for line in lines if not line.startswith("ACL>")]
-    return "\n".join(out).strip()
+    text = _OTHER_LINE_BREAKS_RE.sub("\n", text)
+    return _ACL_PROMPT_LINE_RE.sub("", text).strip()
+
+
+def _strip_echo(raw: bytes) -> str:
+    """Decode one prompt-terminated response and drop the echoed command."""
+    # Decode and strip echoed command (first line) from output
+    text = raw.decode(errors="replace").strip()
+    if "\n" in text:
+        text = text.split("\n", 1)[1].strip()
+    else:
+        # Output is only the echoed command - no actual output
+        text = ""
+    return text
 
 
 class ACLSession:
@@ -105,14 +132,55 @@ class ACLSession:
         except Exception as e:
             raise ACLError(str(e)) from e
 
-        # Decode and strip echoed command (first line) from output
-        text = raw.decode(errors="replace").strip()
-        if "\n" in text:
-            text = text.split("\n", 1)[1].strip()
-        else:
-            # Output is only the echoed command - no actual output
-            text = ""
-        return text
+        return _strip_echo(raw)
+
+    def send_many(self, commands: list[str], timeout: float | None = None) -> list[str]:
+        """Send several commands in one write and return each command's output.
+
+        All commands are written to the interpreter at once, then one prompt
+        is awaited per command, so N commands cost a single send instead of
+        N send/wait round trips. Each command is still a separate script
+        execution, same as ``send()``.
+
+        Replies are matched to commands by counting prompts, so a command
+        must not contain a newline (it would produce extra prompts and shift
+        every following reply). If a batch fails partway, e.g. on timeout,
+        the remaining prompts are still pending in the interpreter, so the
+        session is closed rather than left out of step.
+
+        Args:
+            commands: ACL command strings, one per interpreter line
+            timeout: Override default timeout (applies to each prompt wait)
+
+        Returns:
+            Output of each command, in order, with prompts and echoes stripped
+
+        Raises:
+            ACLError: If the session is closed, the process exits, or prompt
+                times out (the session is closed in the latter two cases)
+            ValueError: If commands is empty or a command contains a newline
+        """
+        if self._closed:
+            raise ACLError("ACL session is closed")
+        if not commands:
+            raise ValueError("commands must not be empty")
+        for command in commands:
+            if "\n" in command:
+                raise ValueError(f"command must not contain a newline: {command!r}")
+
+        effective_timeout = timeout if timeout is not None else self._timeout
+
+        try:
+            self._proc.send_bytes(("\n".join(commands) + "\n").encode())
+            raws = [self._proc.read_until(_ACL_PROMPT, timeout=effective_timeout) for _ in commands]
+        except Exception as e:
+            # Unread prompts from this batch would be taken as later replies
+            self.close()
+            if isinstance(e, ACLError):
+                raise
+            raise ACLError(f"{e} (ACL session closed)") from e
+
+        return [_strip_echo(raw) for raw in raws]
 
     def close(self) -> None:
         """Close the ACL session (closes the SSH channel, not the SSHClient)."""
@@ -131,3 +199,169 @@ class ACLSession:
     def __repr__(self) -> str:
         state = "closed" if self._closed else "open"
         return f"ACLSession({state})"
+
+
+class AsyncACLSession:
+    """asyncio variant of ACLSession.
+
+    Waits for the ACL prompt with ``loop.add_reader()`` on the channel's
+    fileno() instead of blocking a thread, so many sessions (on one or
+    several SSHClients) can be driven concurrently from a single event loop,
+    e.g. with ``asyncio.gather``. Same semantics as ACLSession otherwise:
+    each ``send()`` is a separate script execution.
+
+    Opening the channel (and the SSH connection, if not yet established) and
+    writing commands run in a worker thread. Requires an event loop that supports
+    ``add_reader()`` - the default loop on Linux/macOS, not Windows' proactor.
+
+    Not safe for concurrent ``send()`` calls on one session - use one session
+    per concurrent task instead.
+
+    Args:
+        ssh: SSHClient instance
+        timeout: Default timeout for prompt detection in seconds
+
+    Usage:
+        async with ssh.async_acl_session() as acl:
+            out = await acl.send("read M:OUTTMP")
+
+        # Or explicitly:
+        acl = AsyncACLSession(ssh_client)
+        await acl.open()
+        await acl.send("read M:OUTTMP")
+        await acl.close()
+    """
+
+    def __init__(self, ssh: SSHClient, *, timeout: float = 30.0):
+        self._ssh = ssh
+        self._timeout = timeout
+        self._channel: paramiko.Channel | None = None
+        self._buf = bytearray()
+        self._closed = False
+
+    async def open(self) -> None:
+        """Start the remote ``acl`` process and wait for its first prompt."""
+        if self._closed:
+            raise ACLError("ACL session is closed")
+        if self._channel is not None:
+            return
+        try:
+            self._channel = await asyncio.to_thread(self._ssh.open_channel, "acl", timeout=self._timeout)
+            await self._read_until_prompt(self._timeout)
+        except Exception as e:
+            await self.close()
+            raise ACLError(f"Failed to start ACL session: {e}") from e
+        logger.debug("Async ACL session opened")
+
+    async def send(self, command: str, timeout: float | None = None) -> str:
+        """Send a command to the ACL interpreter and return the output.
+
+        Args:
+            command: ACL command string
+            timeout: Override default timeout for this command
+
+        Returns:
+            Command output with prompts and echoed command stripped
+
+        Raises:
+            ACLError: If the session is not open, the process exits, or prompt times out
+        """
+        if self._closed:
+            raise ACLError("ACL session is closed")
+        if self._channel is None:
+            raise ACLError("ACL session is not open")
+
+        effective_timeout = timeout if timeout is not None else self._timeout
+        try:
+            # sendall() blocks while the channel window is full; keep it off the loop
+            await asyncio.to_thread(self._channel.sendall, f"{command}\n".encode())
+        except Exception as e:
+            raise ACLError(str(e)) from e
+        raw = await self._read_until_prompt(effective_timeout)
+        return _strip_echo(raw)
+
+    async def _read_until_prompt(self, timeout: float) -> bytes:
+        # Same read size, buffer bound and poll interval as the sync session
+        from pacsys.ssh import RemoteProcess
+
+        chan = self._channel
+        assert chan is not None
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        scan_from = 0
+
+        while True:
+            idx = self._buf.find(_ACL_PROMPT, scan_from)
+            if idx >= 0:
+                output = bytes(self._buf[:idx])
+                del self._buf[: idx + _ACL_PROMPT_LEN]
+                return output
+            scan_from = max(0, len(self._buf) - _ACL_PROMPT_LEN + 1)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ACLError(f"Timed out waiting for ACL prompt after {timeout}s")
+
+            if chan.recv_stderr_ready():
+                chan.recv_stderr(RemoteProcess._READ_SIZE)
+
+            if chan.recv_ready():
+                data = chan.recv(RemoteProcess._READ_SIZE)
+                if not data:
+                    raise ACLError("Channel closed while waiting for ACL prompt")
+                self._buf += data
+                if len(self._buf) > RemoteProcess._MAX_BUF:
+                    raise ACLError(f"Buffer exceeded {RemoteProcess._MAX_BUF} bytes waiting for ACL prompt")
+            elif chan.closed or chan.exit_status_ready():
+                raise ACLError(
+                    f"Process exited while waiting for ACL prompt (buffer tail: {bytes(self._buf[-200:])!r})"
+                )
+            else:
+                await self._wait_readable(loop, chan, min(RemoteProcess._POLL_INTERVAL, remaining))
+
+    @staticmethod
+    async def _wait_readable(loop: asyncio.AbstractEventLoop, chan: paramiko.Channel, timeout: float) -> None:
+        """Suspend until paramiko signals stdout data/EOF on the channel fd, or timeout.
+
+        After EOF the fd stays readable while recv_ready() is False, so in that
+        case sleep out the interval instead of returning straight away.
+        """
+        fut = loop.create_future()
+        fd = chan.fileno()
+        loop.add_reader(fd, lambda: fut.done() or fut.set_result(None))
+        try:
+            await asyncio.wait_for(fut, timeout)
+        except asyncio.TimeoutError:
+            return
+        finally:
+            loop.remove_reader(fd)
+        if not chan.recv_ready():
+            await asyncio.sleep(timeout)
+
+    async def close(self) -> None:
+        """Close the ACL session (closes the SSH channel, not the SSHClient)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._channel is not None:
+            try:
+                self._channel.close()
+            except Exception:
+                pass
+        logger.debug("Async ACL session closed")
+
+    async def __aenter__(self) -> AsyncACLSession:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        if self._closed:
+            state = "closed"
+        elif self._channel is None:
+            state = "not opened"
+        else:
+            state = "open"
+        return f"AsyncACLSession({state})"
@@ -11,6 +11,7 @@ from pacsys.types import Reading
 logger = logging.getLogger(__name__)
 
 _DEFAULT_BUFFER_MAXSIZE = 10_000
+_DROP_LOG_INTERVAL_NS = 5_000_000_000
 
 
 class AsyncSubscriptionHandle:
@@ -29,7 +30,7 @@ class AsyncSubscriptionHandle:
         self._task: Optional[asyncio.Task] = None
         self._callback_task: Optional[asyncio.Task] = None
         self._drop_count = 0
-        self._last_drop_log = 0.0
+        self._last_drop_log_ns = -_DROP_LOG_INTERVAL_NS  # first drop always logs
 
     @property
     def stopped(self) -> bool:
@@ -48,15 +49,15 @@ class AsyncSubscriptionHandle:
             self._queue.put_nowait(reading)
         except asyncio.QueueFull:
             self._drop_count += 1
-            now = time.monotonic()
-            if now - self._last_drop_log >= 5.0:
+            now = time.monotonic_ns()
+            if now - self._last_drop_log_ns >= _DROP_LOG_INTERVAL_NS:
                 logger.warning(
                     "Async subscription buffer full (%d), dropped %d readings",
                     self._maxsize,
                     self._drop_count,
                 )
                 self._drop_count = 0
-                self._last_drop_log = now
+                self._last_drop_log_ns = now
 
     def _signal_stop(self) -> None:
         if self._stopped:
@@ -1,34 +1,41 @@
-"""Shared buffered subscription handle using Condition + deque."""
+"""Shared buffered subscription handle using deque + Event."""
 
 import logging
 import threading
 import time
 from collections import deque
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Sequence
 
 from pacsys.types import Reading, SubscriptionHandle
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_BUFFER_MAXSIZE = 10_000
+_DROP_LOG_INTERVAL_NS = 5_000_000_000
 
 
 class BufferedSubscriptionHandle(SubscriptionHandle):
-    """Base subscription handle with Condition + deque for zero-polling iteration.
+    """Base subscription handle with deque + Event for zero-polling iteration.
+
+    Producers append to the deque without taking a lock and only set the
+    ready event when it is clear, i.e. when a reader may be waiting. Readers
+    clear the event and re-check the deque before blocking, so a wakeup is
+    never lost.
 
     Subclasses must set ``_ref_ids`` and provide ``stop()`` (calling ``_signal_stop()``).
-    Producer threads call ``_dispatch()``, ``_signal_stop()``, ``_signal_error()``.
+    Producer threads call ``_dispatch()`` / ``_dispatch_many()``, ``_signal_stop()``, ``_signal_error()``.
     """
 
     def __init__(self) -> None:
-        self._cond = threading.Condition(threading.Lock())
+        self._lock = threading.Lock()  # guards error/drop bookkeeping, not the buffer
+        self._ready = threading.Event()
         self._buf: deque[Reading] = deque()
         self._maxsize = _DEFAULT_BUFFER_MAXSIZE
         self._stopped = False
         self._exc: Optional[Exception] = None
         self._ref_ids: list[int] = []
         self._drop_count = 0
-        self._last_drop_log = 0.0
+        self._last_drop_log_ns = -_DROP_LOG_INTERVAL_NS  # first drop always logs
 
     # -- Properties -----------------------------------------------------------
 
@@ -50,40 +57,62 @@ class BufferedSubscriptionHandle(SubscriptionHandle):
         """Enqueue a reading, waking any blocked reader."""
         if self._stopped:
             return
-        with self._cond:
-            if self._stopped:
-                return
-            if len(self._buf) >= self._maxsize:
-                self._drop_count += 1
-                now = time.monotonic()
-                if now - self._last_drop_log >= 5.0:
-                    logger.warning(
-                        "Subscription buffer full (%d), dropped %d readings",
-                        self._maxsize,
-                        self._drop_count,
-                    )
-                    self._drop_count = 0
-                    self._last_drop_log = now
-                return
-            self._buf.append(reading)
-            self._cond.notify()
+        buf = self._buf
+        if len(buf) >= self._maxsize:
+            self._record_drop()
+            return
+        buf.append(reading)
+        ready = self._ready
+        if not ready.is_set():
+            ready.set()
+
+    def _dispatch_many(self, readings: Sequence[Reading]) -> None:
+        """Enqueue a batch of readings in order, waking any blocked reader once.
+
+        Overflow drops the newest readings of the batch, as with ``_dispatch()``.
+        """
+        if self._stopped or not readings:
+            return
+        buf = self._buf
+        room = self._maxsize - len(buf)
+        if room < len(readings):
+            if room > 0:
+                buf.extend(readings[:room])
+            self._record_drop(len(readings) - max(room, 0))
+        else:
+            buf.extend(readings)
+        ready = self._ready
+        if not ready.is_set():
+            ready.set()
+
+    def _record_drop(self, count: int = 1) -> None:
+        """Count dropped readings; warn at most once per 5s."""
+        with self._lock:
+            self._drop_count += count
+            now = time.monotonic_ns()
+            if now - self._last_drop_log_ns >= _DROP_LOG_INTERVAL_NS:
+                logger.warning(
+                    "Subscription buffer full (%d), dropped %d readings",
+                    self._maxsize,
+                    self._drop_count,
+                )
+                self._drop_count = 0
+                self._last_drop_log_ns = now
 
     def _signal_stop(self) -> None:
         """Idempotent stop - wake all waiters."""
         if self._stopped:
             return
-        with self._cond:
-            self._stopped = True
-            self._cond.notify_all()
+        self._stopped = True
+        self._ready.set()
 
     def _signal_error(self, exc: Exception) -> None:
         """Idempotent error - first error wins, then stop."""
-        with self._cond:
+        with self._lock:
             if self._exc is None:
                 self._exc = exc
-            if not self._stopped:
-                self._stopped = True
-            self._cond.notify_all()
+            self._stopped = True
+        self._ready.set()
 
     # -- Consumer API (called from user thread) -------------------------------
 
@@ -94,47 +123,31 @@ class BufferedSubscriptionHandle(SubscriptionHandle):
         if getattr(self, "_is_callback_mode", False):
             raise RuntimeError("Cannot iterate subscription with callback; readings are pushed to callback")
         start = time.monotonic()
+        buf = self._buf
+        ready = self._ready
 
         while True:
-            reading = None
-            with self._cond:
-                # Try to pop a buffered reading
-                if self._buf:
-                    reading = self._buf.popleft()
-                else:
-                    # No data - check terminal conditions
-                    if self._exc is not None:
-                        raise self._exc
-                    if self._stopped:
-                        return
-
-                    # Compute wait time
-                    if timeout == 0:
-                        return
-                    elif timeout is not None:
-                        remaining = timeout - (time.monotonic() - start)
-                        if remaining <= 0:
-                            return
-                        wait = remaining
-                    else:
-                        wait = None
-
-                    self._cond.wait(timeout=wait)
-
-                    # Re-check after wakeup
-                    if self._buf:
-                        reading = self._buf.popleft()
-                    elif self._exc is not None:
-                        raise self._exc
-                    elif self._stopped:
+            try:
+                reading = buf.popleft()
+            except IndexError:
+                # Clear before re-checking so a dispatch racing with us re-sets it
+                ready.clear()
+                if buf:
+                    continue
+                if self._exc is not None:
+                    raise self._exc
+                if self._stopped:
+                    return
+
+                if timeout == 0:
+                    return
+                elif timeout is not None:
+                    remaining = timeout - (time.monotonic() - start)
+                    if remaining <= 0:
                         return
-                    elif timeout == 0:
-                        return
-                    elif timeout is not None and time.monotonic() - start >= timeout:
-                        return
-                    else:
-                        continue  # spurious wakeup, loop again
+                    ready.wait(remaining)
+                else:
+                    ready.wait()
+                continue
 
-            # Yield outside the lock
-            if reading is not None:
-                yield (reading, self)
+            yield (reading, self)
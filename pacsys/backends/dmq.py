@@ -8,6 +8,7 @@ server (reference_code/gov/fnal/controls/service/dmq/impl/).
 import logging
 import os
 import socket
+import sys
 import threading
 import time
 import uuid
@@ -2055,12 +2056,14 @@ class DMQBackend(Backend):
         handle = sub.handle
 
         # Deliver to all indices sharing this DRF (handles duplicate subscriptions)
-        for i in sub.drf_to_all_indices.get(drf, (idx,)):
-            reading = _reply_to_reading(reply, sub.drfs[i])
-            if sub.callback is not None:
-                self._dispatcher.dispatch_reading(sub.callback, reading, handle)
-            else:
-                handle._dispatch(reading)
+        indices = sub.drf_to_all_indices.get(drf, (idx,))
+        if sub.callback is not None:
+            for i in indices:
+                self._dispatcher.dispatch_reading(sub.callback, _reply_to_reading(reply, sub.drfs[i]), handle)
+        elif len(indices) == 1:
+            handle._dispatch(_reply_to_reading(reply, sub.drfs[indices[0]]))
+        else:
+            handle._dispatch_many([_reply_to_reading(reply, sub.drfs[i]) for i in indices])
 
     def _cancel_subscription_async(self, sub: _SelectSubscription) -> None:
         """Schedule subscription cancellation on the IO loop."""
@@ -2122,6 +2125,10 @@ class DMQBackend(Backend):
         # Ensure IO thread is running
         self._ensure_io_thread()
 
+        # The DRFs key the routing tables and every Reading of this subscription;
+        # intern them once so all subscriptions to a DRF share one str object
+        drfs = [sys.intern(d) for d in drfs]
+
         sub_id = str(uuid.uuid4())
         is_callback_mode = callback is not None
         exchange_name = str(uuid.uuid4())
@@ -28,9 +28,7 @@ def get_qualified_device(device_str: str, prop: DRF_PROPERTY):
         raise ValueError(
             f"Property {prop.name} has no qualifier character and cannot be used in qualified device names"
         )
-    ld = list(device_str)
-    ld[1] = ext
-    return "".join(ld)
+    return device_str[0] + ext + device_str[2:]
 
 
 def parse_device(raw_string, assume_epics: bool = True) -> Device:
@@ -41,7 +39,4 @@ def parse_device(raw_string, assume_epics: bool = True) -> Device:
         if assume_epics:
             return Device(raw_string=raw_string, canonical_string=raw_string)
         raise ValueError(f"{raw_string} is not a valid device")
-    ld = list(raw_string)
-    ld[1] = ":"
-    dev = Device(raw_string=raw_string, canonical_string="".join(ld))
-    return dev
+    return Device(raw_string=raw_string, canonical_string=raw_string[0] + ":" + raw_string[2:])
@@ -1,3 +1,5 @@
+import copy
+import functools
 import re
 
 from .device import get_qualified_device, parse_device
@@ -188,6 +190,17 @@ class DataRequest:
 def parse_request(device_str: str) -> DataRequest:
     if device_str is None:
         raise ValueError("device_str must not be None")
+    # DataRequest and its range/event objects are mutable, so hand out copies
+    # rather than the cached instances (their other members are enums and strings)
+    req = copy.copy(_parse_request(device_str))
+    if req.range is not None:
+        req.range = copy.copy(req.range)
+    req.event = copy.copy(req.event)
+    return req
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_request(device_str: str) -> DataRequest:
     if "<-" in device_str:
         splits = device_str.split("<-")
         if len(splits) != 2:
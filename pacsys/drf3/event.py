@@ -1,14 +1,16 @@
-import math
 import re
 from typing import Optional
 
 # DRF2 time-freq: dec-number [ S | M | U | H | K ]
 _TIME_FREQ_RE = re.compile(r"^(\d+)([SMUHK])?$", re.IGNORECASE)
+_PERIODIC_RE = re.compile("(?i)(P|Q)(?:,(\\w+)(?:,(F|FALSE|T|TRUE))?)?" + "$")
+_CLOCK_RE = re.compile("(?i)E,([0-9A-F]+)(?:,([HSE])(?:,(\\w+))?)?" + "$")
+_STATE_RE = re.compile("(?i)S,(\\S+),(\\d+),(\\w+),(=|!=|\\*|>|<|<=|>=)" + "$")
 
 
-def _java_round(x: float) -> int:
-    """Match Java Math.round() -- floor(x + 0.5), rounds .5 up."""
-    return math.floor(x + 0.5)
+def _java_round_div(a: int, b: int) -> int:
+    """Java Math.round(a / b) for non-negative ints -- floor(a/b + 0.5), without floats."""
+    return (2 * a + b) // (2 * b)
 
 
 def _parse_time_freq(raw: str) -> int:
@@ -25,11 +27,11 @@ def _parse_time_freq(raw: str) -> int:
     if unit == "M":
         return num
     if unit == "U":
-        return _java_round(num / 1000)
+        return _java_round_div(num, 1000)
     if unit == "H":
-        return _java_round(1000 / num)
+        return _java_round_div(1000, num)
     if unit == "K":
-        return _java_round(1000 / (num * 1000))
+        return _java_round_div(1, num)
     raise ValueError(f"Bad time-freq unit: {unit}")
 
 
@@ -86,7 +88,7 @@ class ImmediateEvent(DRF_EVENT):
 class PeriodicEvent(DRF_EVENT):
     def __init__(self, raw_string, mode):
         super().__init__(raw_string, mode)
-        match = re.match("(?i)(P|Q)(?:,(\\w+)(?:,(F|FALSE|T|TRUE))?)?" + "$", raw_string)
+        match = _PERIODIC_RE.match(raw_string)
         if match is None:
             raise ValueError(f"Bad periodic event {raw_string}")
         imm = True
@@ -103,7 +105,7 @@ class PeriodicEvent(DRF_EVENT):
 class ClockEvent(DRF_EVENT):
     def __init__(self, raw_string, mode):
         super().__init__(raw_string, mode)
-        match = re.match("(?i)E,([0-9A-F]+)(?:,([HSE])(?:,(\\w+))?)?" + "$", raw_string)
+        match = _CLOCK_RE.match(raw_string)
         if match is None:
             raise ValueError(f"Bad clock event {raw_string}")
         evt = int(match.group(1), 16)
@@ -136,6 +138,6 @@ class NeverEvent(DRF_EVENT):
 class StateEvent(DRF_EVENT):
     def __init__(self, raw_string, mode):
         super().__init__(raw_string, mode)
-        match = re.match("(?i)S,(\\S+),(\\d+),(\\w+),(=|!=|\\*|>|<|<=|>=)" + "$", raw_string)
+        match = _STATE_RE.match(raw_string)
         if match is None:
             raise ValueError(f"Bad state event {raw_string}")
@@ -17,6 +17,9 @@ class DRF_PROPERTY(Enum):
 
 DRF_PROPERTY_SHORTHANDS = {el.name: el.value for el in DRF_PROPERTY if el.value is not None}
 
+# Qualifier character (device_str[1]) -> property
+_QUALIFIER_TO_PROPERTY = {el.value: el for el in DRF_PROPERTY if el.value is not None}
+
 DRF_PROPERTY_ALIASES = {
     "READING": DRF_PROPERTY.READING,
     "READ": DRF_PROPERTY.READING,
@@ -68,7 +71,5 @@ def parse_property(raw_string: str) -> DRF_PROPERTY:
 def get_default_property(raw_string: str) -> DRF_PROPERTY:
     char = raw_string[1]
     if len(raw_string) > 2:
-        values = [el.value for el in DRF_PROPERTY if el.value is not None]
-        if char in values:
-            return DRF_PROPERTY(char)
+        return _QUALIFIER_TO_PROPERTY.get(char, DRF_PROPERTY.READING)
     return DRF_PROPERTY.READING
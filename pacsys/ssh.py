@@ -18,8 +18,10 @@ Example:
 
 from __future__ import annotations
 
+import functools
 import getpass
 import logging
+import re
 import select
 import socket
 import socketserver
@@ -27,12 +29,12 @@ import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator, Optional, Union
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Sequence, Union
 
 import paramiko
 
 if TYPE_CHECKING:
-    from pacsys.acl_session import ACLSession
+    from pacsys.acl_session import ACLSession, AsyncACLSession
 
 logger = logging.getLogger(__name__)
 
@@ -298,6 +300,16 @@ class SFTPSession:
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=64)
+def _marker_pattern(markers: tuple[bytes, ...]) -> tuple[re.Pattern[bytes], dict[bytes, int]]:
+    """Compiled alternation for read_until_any(), plus marker -> first index in markers."""
+    pattern = re.compile(b"|".join(re.escape(m) for m in markers))
+    positions: dict[bytes, int] = {}
+    for i, m in enumerate(markers):
+        positions.setdefault(m, i)
+    return pattern, positions
+
+
 class RemoteProcess:
     """Persistent interactive process over SSH. Dumb bidirectional pipe.
 
@@ -310,11 +322,15 @@ class RemoteProcess:
     """
 
     _MAX_BUF = 16 * 1024 * 1024  # 16 MB
+    # Matches paramiko's default channel window, so one recv takes everything buffered
+    _READ_SIZE = 2 * 1024 * 1024
+    # Upper bound on one idle wait, so stderr and exit status are still serviced
+    _POLL_INTERVAL = 0.05
 
     def __init__(self, ssh: SSHClient, command: str, *, timeout: float = 30.0):
         self._channel = ssh.open_channel(command, timeout=timeout)
         self._timeout = timeout
-        self._buf = b""
+        self._buf = bytearray()
         self._closed = False
 
     def send_line(self, line: str) -> None:
@@ -334,37 +350,99 @@ class RemoteProcess:
             SSHTimeoutError: If timeout expires before marker found
             SSHError: If channel closes before marker found
         """
+        buf = self._buf
+        marker_len = len(marker)
+
+        def search(scan_from: int) -> tuple[int, int, int] | None:
+            idx = buf.find(marker, scan_from)
+            return None if idx < 0 else (idx, idx + marker_len, 0)
+
+        return self._read_until_match(search, marker_len, f"marker {marker!r}", timeout)[0]
+
+    def read_until_any(self, markers: Sequence[bytes], timeout: float | None = None) -> tuple[bytes, int]:
+        """Read until any of markers found in stream.
+
+        Scans each chunk once for all markers. The earliest match in the
+        stream wins; on a tie at the same position the first listed marker
+        wins. The matched marker is consumed from buffer.
+
+        The tie rule only sees bytes received so far: if a marker is listed
+        before a shorter marker that is its prefix (e.g. ``[b"> >", b"> "]``),
+        which one matches depends on whether the longer one had fully arrived.
+        List such markers shortest first, or avoid prefix overlaps.
+
+        Returns:
+            (bytes before the marker, index of the matched marker in markers)
+
+        Raises:
+            ValueError: If markers is empty
+            SSHTimeoutError: If timeout expires before any marker found
+            SSHError: If channel closes before any marker found
+        """
+        if not markers:
+            raise ValueError("markers must not be empty")
+        key = tuple(bytes(m) for m in markers)
+        pattern, positions = _marker_pattern(key)
+        buf = self._buf
+
+        def search(scan_from: int) -> tuple[int, int, int] | None:
+            match = pattern.search(buf, scan_from)
+            if match is None:
+                return None
+            return match.start(), match.end(), positions[match.group()]
+
+        what = f"any of markers {list(key)!r}"
+        return self._read_until_match(search, max(len(m) for m in key), what, timeout)
+
+    def _read_until_match(
+        self,
+        search: Callable[[int], tuple[int, int, int] | None],
+        max_len: int,
+        what: str,
+        timeout: float | None,
+    ) -> tuple[bytes, int]:
+        """Receive into the buffer until search() finds a match; consume through its end.
+
+        search(scan_from) returns (start, end, tag) for the earliest match at or
+        after scan_from, or None.
+        """
         t = timeout if timeout is not None else self._timeout
         deadline = time.monotonic() + t
+        # Bytes before scan_from were already searched; only rescan the last
+        # max_len - 1 of them so a marker split across chunks is still found.
+        scan_from = 0
 
         while True:
-            idx = self._buf.find(marker)
-            if idx >= 0:
-                output = self._buf[:idx]
-                self._buf = self._buf[idx + len(marker) :]
-                return output
+            found = search(scan_from)
+            if found is not None:
+                idx, end, tag = found
+                # Copy the prefix straight out of the buffer; bytes(buf[:idx])
+                # would build an intermediate bytearray of the same size first.
+                with memoryview(self._buf) as view, view[:idx] as head:
+                    output = head.tobytes()
+                del self._buf[:end]
+                return output, tag
+            scan_from = max(0, len(self._buf) - max_len + 1)
 
             remaining = deadline - time.monotonic()
             if remaining <= 0:
                 raise SSHTimeoutError(
-                    f"Timed out waiting for marker {marker!r} after {t}s (buffer tail: {self._buf[-200:]!r})"
+                    f"Timed out waiting for {what} after {t}s (buffer tail: {bytes(self._buf[-200:])!r})"
                 )
 
             self._drain_stderr()
 
             if self._channel.recv_ready():
-                data = self._channel.recv(65536)
+                data = self._channel.recv(self._READ_SIZE)
                 if not data:
-                    raise SSHError(f"Channel closed while waiting for marker {marker!r}")
+                    raise SSHError(f"Channel closed while waiting for {what}")
                 self._buf += data
                 if len(self._buf) > self._MAX_BUF:
-                    raise SSHError(f"Buffer exceeded {self._MAX_BUF} bytes waiting for marker {marker!r}")
+                    raise SSHError(f"Buffer exceeded {self._MAX_BUF} bytes waiting for {what}")
             elif self._channel.closed or self._channel.exit_status_ready():
-                raise SSHError(
-                    f"Process exited while waiting for marker {marker!r} (buffer tail: {self._buf[-200:]!r})"
-                )
+                raise SSHError(f"Process exited while waiting for {what} (buffer tail: {bytes(self._buf[-200:])!r})")
             else:
-                self._channel.status_event.wait(min(0.05, remaining))
+                self._wait_readable(min(self._POLL_INTERVAL, remaining))
 
     def read_for(self, seconds: float) -> bytes:
         """Read all data arriving within timeout. Returns on idle."""
@@ -378,7 +456,7 @@ class RemoteProcess:
             self._drain_stderr()
 
             if self._channel.recv_ready():
-                data = self._channel.recv(65536)
+                data = self._channel.recv(self._READ_SIZE)
                 if not data:
                     break
                 self._buf += data
@@ -387,16 +465,35 @@ class RemoteProcess:
             elif self._channel.closed or self._channel.exit_status_ready():
                 break
             else:
-                self._channel.status_event.wait(min(0.05, remaining))
+                self._wait_readable(min(self._POLL_INTERVAL, remaining))
 
-        result = self._buf
-        self._buf = b""
+        result = bytes(self._buf)
+        self._buf.clear()
         return result
 
+    def _wait_readable(self, timeout: float) -> None:
+        """Block until stdout data or EOF arrives on the channel, or timeout expires.
+
+        paramiko signals the channel's fileno() as soon as its stdout buffer
+        receives data, so this returns on arrival instead of sleeping out a
+        fixed poll interval (see _bidirectional_forward for the Windows note).
+
+        Once EOF is received paramiko leaves the fileno readable for good while
+        recv_ready() stays False, so readable-without-data falls back to
+        sleeping on the exit status instead of returning straight away.
+        """
+        readable, _, _ = select.select([self._channel], [], [], timeout)
+        if readable and not self._channel.recv_ready():
+            self._channel.status_event.wait(timeout)
+
     def _drain_stderr(self) -> None:
-        """Drain stderr to prevent deadlock."""
-        while self._channel.recv_stderr_ready():
-            self._channel.recv_stderr(65536)
+        """Drain stderr to prevent deadlock.
+
+        A single read takes everything buffered, so each wait cycle costs one
+        readiness check plus at most one recv instead of a ready/recv loop.
+        """
+        if self._channel.recv_stderr_ready():
+            self._channel.recv_stderr(self._READ_SIZE)
 
     @property
     def alive(self) -> bool:
@@ -432,6 +529,14 @@ class RemoteProcess:
 HopSpec = Union[str, SSHHop]
 
 
+@functools.lru_cache(maxsize=128)
+def _acl_script_payload(commands: tuple[str, ...]) -> bytes:
+    """Encoded ACL script body; cached since pollers resend the same command lists."""
+    # One str join + one encode beats encoding each command and joining bytes
+    # (the per-item encode() calls dominate for typical short commands).
+    return ("\n".join(commands) + "\n").encode()
+
+
 def _normalize_hops(hops: Union[HopSpec, list[HopSpec]]) -> list[SSHHop]:
     """Normalize hop specifications into a list of SSHHop objects."""
     if isinstance(hops, (str, SSHHop)):
@@ -461,6 +566,9 @@ class SSHClient:
         auth: Optional KerberosAuth for GSSAPI hops. If None and any hop uses
               gssapi auth, credentials are validated at init (fail fast).
         connect_timeout: TCP connection timeout in seconds (default 10.0).
+        keepalive_interval: Seconds between SSH keepalive packets on every hop
+              (default 30, 0 disables). Keeps long-lived ACL sessions and
+              tunnels from being dropped by idle NAT/firewall timeouts.
 
     Example:
         with SSHClient("target.fnal.gov") as ssh:
@@ -473,10 +581,12 @@ class SSHClient:
         hops: Union[HopSpec, list[HopSpec]],
         auth: Optional[object] = None,
         connect_timeout: float = 10.0,
+        keepalive_interval: int = 30,
     ):
         self._hops = _normalize_hops(hops)
         self._auth = auth
         self._connect_timeout = connect_timeout
+        self._keepalive_interval = keepalive_interval
 
         # Validate GSSAPI availability if any hop needs it
         needs_gssapi = any(h.auth_method == "gssapi" for h in self._hops)
@@ -541,7 +651,7 @@ class SSHClient:
 
                 current_transport.start_client()
                 self._authenticate(current_transport, hop)
-                current_transport.set_keepalive(30)
+                current_transport.set_keepalive(self._keepalive_interval)
                 self._transports.append(current_transport)
                 current_transport = None  # now owned by _transports
 
@@ -611,13 +721,15 @@ class SSHClient:
         self._ensure_connected()
         return self._transports[-1]
 
-    def exec(self, command: str, timeout: Optional[float] = None, input: Optional[str] = None) -> CommandResult:
+    def exec(
+        self, command: str, timeout: Optional[float] = None, input: Optional[Union[str, bytes]] = None
+    ) -> CommandResult:
         """Execute a command on the remote host.
 
         Args:
             command: Shell command to execute
             timeout: Command timeout in seconds (None = no timeout)
-            input: Optional stdin data to send
+            input: Optional stdin data to send (str is UTF-8 encoded)
 
         Returns:
             CommandResult with exit_code, stdout, stderr
@@ -635,7 +747,7 @@ class SSHClient:
             chan.exec_command(command)
 
             if input is not None:
-                chan.sendall(input.encode())
+                chan.sendall(input if isinstance(input, bytes) else input.encode())
             chan.shutdown_write()
 
             deadline = time.monotonic() + timeout if timeout is not None else None
@@ -802,8 +914,11 @@ class SSHClient:
     def acl(self, command: str | list[str], timeout: float | None = None) -> str:
         """Execute ACL command(s) and return output text.
 
-        Commands are written to a temp script file on the remote host and
-        executed as ``acl /tmp/pacsys_acl_XXXX.acl``.
+        Commands are written to a temp script file on the remote host, then
+        executed as ``acl /tmp/pacsys_acl_XXXX.acl`` and removed in the same
+        remote command (two channels per call). Each call opens new
+        channels on the client's existing SSH transport; the connection
+        handshake and authentication happen only once per client.
 
         Args:
             command: ACL command string, or list of commands
@@ -828,12 +943,12 @@ class SSHClient:
         return self._acl_script(command, effective_timeout, _strip_acl_output)
 
     def _acl_script(self, commands: list[str], timeout: float, strip_fn) -> str:
-        """Write commands to a temp script on the remote host and run via acl."""
+        """Write commands to a temp script on the remote host, run it via acl, then delete it."""
         import uuid
 
         from pacsys.errors import ACLError
 
-        script = "\n".join(commands) + "\n"
+        script = _acl_script_payload(tuple(commands))
         name = f"/tmp/pacsys_acl_{uuid.uuid4().hex[:8]}.acl"
 
         # Write script file
@@ -841,16 +956,15 @@ class SSHClient:
         if not write_result.ok:
             raise ACLError(f"Failed to write ACL script: {write_result.stderr.strip()}")
 
-        try:
-            result = self.exec(f"acl {name}", timeout=timeout)
-            # ACL exits non-zero on script errors (bad device, etc.) but
-            # still produces useful output. Only raise on real failures.
-            if not result.ok and (result.stderr.strip() or not result.stdout.strip()):
-                msg = result.stderr.strip() or f"exit code {result.exit_code}"
-                raise ACLError(f"ACL script failed: {msg}")
-            return strip_fn(result.stdout)
-        finally:
-            self.exec(f"rm -f {name}", timeout=5.0)
+        # Run and remove the script in one channel; sh -c keeps this
+        # independent of the remote login shell (which may be csh-family).
+        result = self.exec(f'sh -c \'acl "$1"; rc=$?; rm -f "$1"; exit $rc\' _ {name}', timeout=timeout)
+        # ACL exits non-zero on script errors (bad device, etc.) but
+        # still produces useful output. Only raise on real failures.
+        if not result.ok and (result.stderr.strip() or not result.stdout.strip()):
+            msg = result.stderr.strip() or f"exit code {result.exit_code}"
+            raise ACLError(f"ACL script failed: {msg}")
+        return strip_fn(result.stdout)
 
     def acl_session(self, *, timeout: float = 30.0) -> ACLSession:
         """Open a persistent ACL interpreter session.
@@ -869,6 +983,22 @@ class SSHClient:
 
         return ACLSession(self, timeout=timeout)
 
+    def async_acl_session(self, *, timeout: float = 30.0) -> AsyncACLSession:
+        """Create an asyncio ACL interpreter session (opened on ``async with``).
+
+        Like acl_session(), but prompt waits suspend on the event loop instead
+        of blocking a thread, so many sessions can run concurrently.
+
+        Args:
+            timeout: Default timeout for prompt detection in seconds
+
+        Returns:
+            AsyncACLSession (use as async context manager, or await open()/close())
+        """
+        from pacsys.acl_session import AsyncACLSession
+
+        return AsyncACLSession(self, timeout=timeout)
+
     def sftp(self) -> SFTPSession:
         """Open an SFTP session on the remote host.
 
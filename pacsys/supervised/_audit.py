@@ -11,15 +11,29 @@ Two modes controlled by ``log_responses``:
 
 Binary protobuf framing: ``tag_byte + varint_length + serialized_bytes``.
 Tag identifies the message type so the file is self-describing.
+
+JSON lines are encoded with ``orjson`` when it is installed
+(``pip install pacsys[speedups]``), otherwise with the stdlib ``json`` module.
 """
 
+import itertools
 import json
+import logging
+import os
+import queue
 import threading
-from datetime import datetime, timezone
+import time
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 from ._policies import PolicyDecision, RequestContext
 
+logger = logging.getLogger("pacsys.supervised")
+
 TAG_READ_REQUEST = 0x00
 TAG_READ_REPLY = 0x01
 TAG_SETTING_REQUEST = 0x02
@@ -28,9 +42,18 @@ TAG_SETTING_REPLY = 0x03
 _REQUEST_TAGS = {"Read": TAG_READ_REQUEST, "Set": TAG_SETTING_REQUEST}
 _RESPONSE_TAGS = {"Read": TAG_READ_REPLY, "Set": TAG_SETTING_REPLY}
 
+# Flushed batches the background writer may fall behind by before callers block.
+_BACKGROUND_QUEUE_MAXSIZE = 1024
+
+# Pre-built one-byte varints: record lengths under 128 are the common case.
+_SINGLE_BYTE = tuple(bytes((i,)) for i in range(0x80))
+
 
 def _encode_varint(write, value):
     """Encode an integer as a protobuf varint (single write call)."""
+    if value < 0x80:
+        write(_SINGLE_BYTE[value])
+        return
     buf = bytearray()
     bits = value & 0x7F
     value >>= 7
@@ -42,6 +65,64 @@ def _encode_varint(write, value):
     write(buf)
 
 
+# O_BINARY only exists (and matters) on Windows.
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+
+def _open_append(path: str) -> int:
+    """Open *path* for appending and return the raw file descriptor."""
+    return os.open(path, _OPEN_FLAGS, 0o644)
+
+
+# writev() is POSIX-only; elsewhere pending records are joined and written.
+_writev = getattr(os, "writev", None)
+# Linux and macOS both cap a single writev() at 1024 buffers.
+_IOV_MAX = 1024
+
+
+def _write_buffer(fd: int, data: bytes) -> None:
+    """Write all of *data* to *fd*, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _write_all(fd: int, chunks: list) -> None:
+    """Write *chunks* to *fd* in order, gathering them with writev() when available."""
+    if _writev is None:
+        _write_buffer(fd, b"".join(chunks))
+        return
+    for start in range(0, len(chunks), _IOV_MAX):
+        batch = chunks[start : start + _IOV_MAX]
+        written = _writev(fd, batch)
+        if written < sum(map(len, batch)):
+            _write_buffer(fd, b"".join(batch)[written:])
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp; replaced
+# as a whole tuple so concurrent loggers never see a torn pair.
+_ts_cache = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a ``+00:00`` offset."""
+    global _ts_cache
+    now_us = time.time_ns() // 1000
+    sec, us = divmod(now_us, 1_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{us:06d}+00:00"
+
+
+def _json_line(entry: dict) -> bytes:
+    """Serialize one audit entry as a compact UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode()
+
+
 class AuditLog:
     """Structured audit log with optional raw protobuf capture.
 
@@ -50,6 +131,13 @@ class AuditLog:
         proto_path: Binary protobuf file path (optional).
         log_responses: Log outgoing responses too (default: False).
         flush_interval: Flush files every N writes (default: 1).
+        background: Hand flushed records to a writer thread instead of
+            writing them on the calling thread (default: False). At most
+            1024 flushed batches are queued; beyond that the logging call
+            blocks until the writer catches up, so records are never
+            dropped. Records still pending in the thread are written by
+            ``close()``. If the writer fails, its first error is re-raised
+            from the next ``log_request()``, ``log_response()`` or ``close()``.
     """
 
     def __init__(
@@ -58,6 +146,7 @@ class AuditLog:
         proto_path: Optional[str] = None,
         log_responses: bool = False,
         flush_interval: int = 1,
+        background: bool = False,
     ):
         if flush_interval < 1:
             raise ValueError(f"flush_interval must be >= 1, got {flush_interval}")
@@ -66,19 +155,27 @@ class AuditLog:
         self._log_responses = log_responses
         self._flush_interval = flush_interval
         self._lock = threading.Lock()
-        self._json_file = None
-        self._proto_file = None
+        # Raw O_APPEND descriptors; records are buffered in the pending lists
+        # and gathered into one writev() per sink on each flush.
+        self._json_fd: Optional[int] = None
+        self._proto_fd: Optional[int] = None
+        self._json_pending: list = []
+        self._proto_pending: list = []
         self._writes_since_flush = 0
-        self._seq = 0
+        self._seq = itertools.count(1)
+        self._background = background
+        self._writer: Optional[threading.Thread] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=_BACKGROUND_QUEUE_MAXSIZE)
+        self._writer_exc: Optional[BaseException] = None
 
     def log_request(self, ctx: RequestContext, decision: PolicyDecision) -> int:
         """Log incoming request. Returns sequence number for correlation."""
         with self._lock:
-            self._seq += 1
-            seq = self._seq
+            self._raise_writer_error()
+            seq = next(self._seq)
 
             entry = {
-                "ts": datetime.now(timezone.utc).isoformat(),
+                "ts": _utc_timestamp(),
                 "seq": seq,
                 "dir": "in",
                 "peer": ctx.peer,
@@ -87,8 +184,11 @@ class AuditLog:
                 "allowed": decision.allowed,
                 "reason": decision.reason,
             }
-            if decision.allowed and decision.ctx is not None and decision.ctx.drfs != ctx.drfs:
-                entry["final_drfs"] = decision.ctx.drfs
+            if decision.allowed and decision.ctx is not None:
+                final_drfs = decision.ctx.drfs
+                # Policies that only replace() other fields share the list; skip the compare.
+                if final_drfs is not ctx.drfs and final_drfs != ctx.drfs:
+                    entry["final_drfs"] = final_drfs
             self._write_json(entry)
 
             if self._proto_path is not None:
@@ -108,8 +208,9 @@ class AuditLog:
             return
 
         with self._lock:
+            self._raise_writer_error()
             entry = {
-                "ts": datetime.now(timezone.utc).isoformat(),
+                "ts": _utc_timestamp(),
                 "seq": seq,
                 "dir": "out",
                 "peer": peer,
@@ -128,40 +229,91 @@ class AuditLog:
             self._maybe_flush()
 
     def _write_json(self, entry: dict):
-        if self._json_file is None:
-            self._json_file = open(self._path, "a")  # noqa: SIM115
-        self._json_file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        if self._json_fd is None:
+            self._json_fd = _open_append(self._path)
+        self._json_pending.append(_json_line(entry))
         self._writes_since_flush += 1
 
     def _write_proto(self, tag: int, data: bytes):
-        if self._proto_file is None:
+        if self._proto_fd is None:
             assert self._proto_path is not None
-            self._proto_file = open(self._proto_path, "ab")  # noqa: SIM115
-        self._proto_file.write(bytes((tag,)))
-        _encode_varint(self._proto_file.write, len(data))
-        self._proto_file.write(data)
+            self._proto_fd = _open_append(self._proto_path)
+        # Header and payload stay separate buffers; writev() gathers them.
+        # Headers are queued until flush, so a shared scratch buffer cannot be
+        # reused; short payloads get a two-byte header without a bytearray.
+        size = len(data)
+        if size < 0x80:
+            header = bytes((tag, size))
+        else:
+            header = bytearray((tag,))
+            _encode_varint(header.extend, size)
+        self._proto_pending += (header, data)
 
     def _maybe_flush(self):
         if self._writes_since_flush >= self._flush_interval:
-            if self._json_file is not None:
-                self._json_file.flush()
-            if self._proto_file is not None:
-                self._proto_file.flush()
-            self._writes_since_flush = 0
+            self._flush()
+
+    def _flush(self):
+        batch = []
+        if self._json_pending:
+            batch.append((self._json_fd, self._json_pending))
+            self._json_pending = []
+        if self._proto_pending:
+            batch.append((self._proto_fd, self._proto_pending))
+            self._proto_pending = []
+        self._writes_since_flush = 0
+        if not batch:
+            return
+        if self._background:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._drain, name="pacsys-audit-writer", daemon=True)
+                self._writer.start()
+            self._queue.put(batch)
+        else:
+            for fd, chunks in batch:
+                _write_all(fd, chunks)
+
+    def _drain(self):
+        """Writer thread: write queued batches until the ``None`` sentinel."""
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            for fd, chunks in batch:
+                try:
+                    _write_all(fd, chunks)
+                except Exception as e:
+                    logger.error("audit background write failed", exc_info=True)
+                    if self._writer_exc is None:
+                        self._writer_exc = e
+
+    def _raise_writer_error(self):
+        """Re-raise (once) the first error hit by the background writer."""
+        exc = self._writer_exc
+        if exc is not None:
+            self._writer_exc = None
+            raise exc
 
     def close(self):
         """Flush and close both files."""
         with self._lock:
-            for f in (self._json_file, self._proto_file):
-                if f is not None:
-                    try:
-                        f.flush()
-                    except Exception:
-                        pass
+            try:
+                self._flush()
+            except Exception:
+                pass
+            if self._writer is not None:
+                self._queue.put(None)
+                self._writer.join()
+                self._writer = None
+            for fd in (self._json_fd, self._proto_fd):
+                if fd is not None:
                     try:
-                        f.close()
+                        os.close(fd)
                     except Exception:
                         pass
-            self._json_file = None
-            self._proto_file = None
+            self._json_fd = None
+            self._proto_fd = None
+            self._json_pending.clear()
+            self._proto_pending.clear()
             self._writes_since_flush = 0
+            self._raise_writer_error()
@@ -515,7 +515,10 @@ class SupervisedServer:
                 logger.warning("Server thread did not stop within 5s, resources may be leaked")
 
         if self._audit_log is not None:
-            self._audit_log.close()
+            try:
+                self._audit_log.close()
+            except Exception:
+                logger.error("audit log close failed", exc_info=True)
 
         logger.info("SupervisedServer stopped")
 
@@ -1,6 +1,8 @@
 """Shared mock helpers for SSH-related unit tests."""
 
+import socket
 import threading
+from collections import deque
 from unittest.mock import MagicMock
 
 import paramiko
@@ -9,6 +11,16 @@ from pacsys.ssh import SSHClient, SSHHop
 
 _RealTransport = paramiko.Transport
 
+_idle_socks: tuple[socket.socket, socket.socket] | None = None
+
+
+def idle_fileno() -> int:
+    """File descriptor that never becomes readable, for mock channels passed to select()."""
+    global _idle_socks
+    if _idle_socks is None:
+        _idle_socks = socket.socketpair()
+    return _idle_socks[0].fileno()
+
 
 def make_mock_transport(active=True):
     t = MagicMock(spec=_RealTransport)
@@ -70,15 +82,16 @@ def make_interactive_channel(responses):
     chan.status_event = threading.Event()
     chan.status_event.set()
     chan.closed = False
+    chan.fileno.return_value = idle_fileno()
 
-    remaining = list(responses)
+    remaining = deque(responses)
 
     def recv_ready():
         return bool(remaining)
 
     def recv(size):
         if remaining:
-            return remaining.pop(0)
+            return remaining.popleft()
         return b""
 
     def exit_status_ready():
@@ -93,3 +106,19 @@ def make_interactive_channel(responses):
     chan.recv_stderr_ready = MagicMock(side_effect=lambda: recv_stderr_ready())
     chan.recv_stderr = MagicMock(side_effect=lambda size: b"")
     return chan
+
+
+def make_eof_channel(data=b""):
+    """Create a real paramiko Channel that has buffered data and then received EOF.
+
+    After EOF paramiko keeps fileno() readable while recv_ready() is False.
+    recv_ready is wrapped so tests can count readiness checks.
+    """
+    chan = paramiko.Channel(0)
+    chan.exec_command = MagicMock()
+    chan.fileno()  # create the event pipe before EOF, as a select() caller would
+    if data:
+        chan.in_buffer.feed(data)
+    chan._handle_eof(None)
+    chan.recv_ready = MagicMock(wraps=chan.recv_ready)
+    return chan
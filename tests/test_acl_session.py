@@ -1,14 +1,23 @@
 """Tests for ACL-over-SSH: one-shot SSHClient.acl() and persistent ACLSession."""
 
+import asyncio
+import socket
 import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pacsys.acl_session import ACLSession, _strip_acl_output
+from pacsys.acl_session import ACLSession, AsyncACLSession, _strip_acl_output
 from pacsys.errors import ACLError
+from pacsys.ssh import RemoteProcess
 
-from .ssh_helpers import connected_ssh, make_exec_channel, make_interactive_channel
+from .ssh_helpers import (
+    connected_ssh,
+    idle_fileno,
+    make_eof_channel,
+    make_exec_channel,
+    make_interactive_channel,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -45,6 +54,26 @@ class TestStripACLOutput:
     def test_no_prompts(self):
         assert _strip_acl_output("just text") == "just text"
 
+    def test_crlf_output(self):
+        """pty-style CRLF line endings are normalized, not left as stray \\r."""
+        text = "\r\nACL> read M:OUTTMP\r\n\r\nM:OUTTMP       =  7.313 DegF\r\nline2\r\n\r\nACL> \r\n"
+        assert _strip_acl_output(text) == "M:OUTTMP       =  7.313 DegF\nline2"
+
+    def test_lone_cr_output(self):
+        assert _strip_acl_output("ACL> cmd\rout1\rout2\r") == "out1\nout2"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "\nACL> read M:OUTTMP\n\nM:OUTTMP = 7.3\n\nACL> \n",
+            "\r\nACL> x\r\n\r\na\rb\x0bc\x0cd\u2028e\r\nACL> \r\n",
+            "ACL>\nonly\x85next\x1cACL> echo\x1d\x1etail",
+        ],
+    )
+    def test_matches_splitlines_semantics(self, text):
+        lines = [line for line in text.splitlines() if not line.startswith("ACL>")]
+        assert _strip_acl_output(text) == "\n".join(lines).strip()
+
 
 # ---------------------------------------------------------------------------
 # One-shot: SSHClient.acl() (script mode - always uses _acl_script)
@@ -59,8 +88,7 @@ class TestSSHClientACL:
         acl_stdout = b"\nACL> read M:OUTTMP\n\nM:OUTTMP       =  72.500 DegF\n\nACL> \n"
         transport.open_session.side_effect = [
             make_exec_channel(exit_code=0),  # cat > script
-            make_exec_channel(stdout=acl_stdout, exit_code=0),  # acl script
-            make_exec_channel(exit_code=0),  # rm -f script
+            make_exec_channel(stdout=acl_stdout, exit_code=0),  # acl script + rm
         ]
 
         result = ssh.acl("read M:OUTTMP")
@@ -72,13 +100,37 @@ class TestSSHClientACL:
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         transport.open_session.side_effect = [
             make_exec_channel(exit_code=0),  # cat > script
-            make_exec_channel(stderr=b"error text\n", exit_code=1),  # acl fails
-            make_exec_channel(exit_code=0),  # rm -f
+            make_exec_channel(stderr=b"error text\n", exit_code=1),  # acl fails, script removed
         ]
 
         with pytest.raises(ACLError, match="error text"):
             ssh.acl("bad command")
 
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_acl_nonzero_exit_with_output_returns_output(self, mock_connect, mock_transport_cls):
+        """ACL exits non-zero on script errors but still prints results - no error without stderr."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        stdout = b"\nACL> read M:OUTTMP\n\nM:OUTTMP       =  72.500 DegF\n\nACL> \n"
+        transport.open_session.side_effect = [
+            make_exec_channel(exit_code=0),
+            make_exec_channel(stdout=stdout, exit_code=1),
+        ]
+
+        assert ssh.acl("read M:OUTTMP") == "M:OUTTMP       =  72.500 DegF"
+
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_acl_nonzero_exit_without_output_raises(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        transport.open_session.side_effect = [
+            make_exec_channel(exit_code=0),
+            make_exec_channel(exit_code=2),
+        ]
+
+        with pytest.raises(ACLError, match="exit code 2"):
+            ssh.acl("read M:OUTTMP")
+
     @patch("paramiko.Transport")
     @patch("socket.create_connection")
     def test_acl_strips_prompts(self, mock_connect, mock_transport_cls):
@@ -87,7 +139,6 @@ class TestSSHClientACL:
         transport.open_session.side_effect = [
             make_exec_channel(exit_code=0),
             make_exec_channel(stdout=stdout, exit_code=0),
-            make_exec_channel(exit_code=0),
         ]
 
         result = ssh.acl("cmd")
@@ -101,13 +152,46 @@ class TestSSHClientACL:
         transport.open_session.side_effect = [
             make_exec_channel(exit_code=0),
             make_exec_channel(stdout=stdout, exit_code=0),
-            make_exec_channel(exit_code=0),
         ]
 
         result = ssh.acl("read M:OUTTMP; read G:AMANDA")
         assert "out1" in result
         assert "out2" in result
 
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_acl_calls_share_transport(self, mock_connect, mock_transport_cls):
+        """Consecutive acl() calls reuse one connection - no re-handshake per call."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        stdout = b"\nACL> x\n\nout\n\nACL> \n"
+        transport.open_session.side_effect = [
+            make_exec_channel(exit_code=0),
+            make_exec_channel(stdout=stdout, exit_code=0),
+            make_exec_channel(exit_code=0),
+            make_exec_channel(stdout=stdout, exit_code=0),
+        ]
+
+        assert ssh.acl("x") == "out"
+        assert ssh.acl("x") == "out"
+        assert mock_connect.call_count == 1
+        assert mock_transport_cls.call_count == 1
+        transport.start_client.assert_called_once()
+
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_acl_calls_resolve_username_once(self, mock_connect, mock_transport_cls):
+        """The OS user lookup happens at connect time only, not per acl() call."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        stdout = b"\nACL> x\n\nout\n\nACL> \n"
+        transport.open_session.side_effect = [
+            make_exec_channel(stdout=stdout, exit_code=0) if i % 2 else make_exec_channel(exit_code=0) for i in range(6)
+        ]
+
+        with patch("getpass.getuser", return_value="testuser") as getuser:
+            for _ in range(3):
+                ssh.acl("x")
+        getuser.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # One-shot: SSHClient.acl() with list (script mode)
@@ -122,13 +206,12 @@ class TestSSHClientACLScript:
         acl_stdout = b"\nACL> read M:OUTTMP\n\nM:OUTTMP       =  72.500 DegF\n\nACL> \n"
         transport.open_session.side_effect = [
             make_exec_channel(exit_code=0),  # cat > script
-            make_exec_channel(stdout=acl_stdout, exit_code=0),  # acl script
-            make_exec_channel(exit_code=0),  # rm -f script
+            make_exec_channel(stdout=acl_stdout, exit_code=0),  # acl script + rm
         ]
 
         result = ssh.acl(["read M:OUTTMP"])
         assert result == "M:OUTTMP       =  72.500 DegF"
-        assert transport.open_session.call_count == 3
+        assert transport.open_session.call_count == 2
 
     @patch("paramiko.Transport")
     @patch("socket.create_connection")
@@ -137,8 +220,7 @@ class TestSSHClientACLScript:
         write_chan = make_exec_channel(exit_code=0)
         transport.open_session.side_effect = [
             write_chan,  # cat > script
-            make_exec_channel(exit_code=0),  # acl script
-            make_exec_channel(exit_code=0),  # rm
+            make_exec_channel(exit_code=0),  # acl script + rm
         ]
 
         ssh.acl(["read M:OUTTMP", "read G:AMANDA"])
@@ -150,15 +232,18 @@ class TestSSHClientACLScript:
     @patch("socket.create_connection")
     def test_acl_list_cleans_up_on_failure(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        run_chan = make_exec_channel(stderr=b"error\n", exit_code=1)  # acl fails, script removed
         transport.open_session.side_effect = [
             make_exec_channel(exit_code=0),  # cat > script
-            make_exec_channel(stderr=b"error\n", exit_code=1),  # acl fails
-            make_exec_channel(exit_code=0),  # rm still runs
+            run_chan,
         ]
 
         with pytest.raises(ACLError, match="ACL script failed"):
             ssh.acl(["bad command"])
-        assert transport.open_session.call_count == 3
+        assert transport.open_session.call_count == 2
+        # Removal is part of the run command, so it happens even when acl fails
+        run_cmd = run_chan.exec_command.call_args[0][0]
+        assert "acl " in run_cmd and "rm -f" in run_cmd
 
     @patch("paramiko.Transport")
     @patch("socket.create_connection")
@@ -177,6 +262,8 @@ class TestSSHClientACLScript:
 
         with pytest.raises(ACLError, match="Failed to write"):
             ssh.acl(["read M:OUTTMP"])
+        # Fails fast: no run channel and no cleanup round trip
+        assert transport.open_session.call_count == 1
 
 
 # ---------------------------------------------------------------------------
@@ -375,6 +462,7 @@ class TestACLSession:
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = MagicMock()
         chan.status_event = threading.Event()
+        chan.fileno.return_value = idle_fileno()
         chan.closed = False
         chan.recv_ready = MagicMock(return_value=False)
         chan.recv_stderr_ready = MagicMock(return_value=False)
@@ -404,6 +492,66 @@ class TestACLSession:
         assert r2 == "output2"
         session.close()
 
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_send_many_single_write(self, mock_connect, mock_transport_cls):
+        """send_many writes all commands at once and splits output per prompt."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel(
+            [
+                b"\nACL> ",
+                b"cmd1\n\noutput1\n\nACL> cmd2\n\nACL> cmd3\n\noutput3\n\nACL> ",
+            ]
+        )
+        transport.open_session.return_value = chan
+
+        session = ACLSession(ssh)
+        results = session.send_many(["cmd1", "cmd2", "cmd3"])
+        assert results == ["output1", "", "output3"]
+        assert chan.sendall.call_count == 1
+        chan.sendall.assert_called_with(b"cmd1\ncmd2\ncmd3\n")
+        session.close()
+
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_send_many_empty_raises(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> "])
+        transport.open_session.return_value = chan
+
+        session = ACLSession(ssh)
+        with pytest.raises(ValueError, match="empty"):
+            session.send_many([])
+        session.close()
+
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_send_many_rejects_newlines(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> "])
+        transport.open_session.return_value = chan
+
+        session = ACLSession(ssh)
+        with pytest.raises(ValueError, match="newline"):
+            session.send_many(["cmd1", "cmd2\ncmd3"])
+        chan.sendall.assert_not_called()
+        session.close()
+
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_send_many_timeout_closes_session(self, mock_connect, mock_transport_cls):
+        """A batch that times out partway leaves prompts pending, so the session is closed."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> ", b"cmd1\n\noutput1\n\nACL> "])
+        transport.open_session.return_value = chan
+
+        session = ACLSession(ssh)
+        with pytest.raises(ACLError, match="session closed"):
+            session.send_many(["cmd1", "cmd2"], timeout=0.1)
+        chan.close.assert_called()
+        with pytest.raises(ACLError, match="closed"):
+            session.send("cmd3")
+
     @patch("paramiko.Transport")
     @patch("socket.create_connection")
     def test_prompt_split_across_chunks(self, mock_connect, mock_transport_cls):
@@ -436,5 +584,191 @@ class TestACLSession:
         transport.open_session.return_value = chan
 
         session = ACLSession(ssh)
-        chan.recv_stderr.assert_called()
+        # One read per wait cycle empties stderr, no ready/recv loop
+        chan.recv_stderr.assert_called_once()
         session.close()
+
+
+# ---------------------------------------------------------------------------
+# AsyncACLSession
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncACLSession:
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_send_returns_output(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel(
+            [
+                b"\nACL> ",
+                b"read M:OUTTMP\n\nM:OUTTMP       =  72.500 DegF\n\nACL> ",
+            ]
+        )
+        transport.open_session.return_value = chan
+
+        async with ssh.async_acl_session() as session:
+            assert isinstance(session, AsyncACLSession)
+            result = await session.send("read M:OUTTMP")
+        assert result == "M:OUTTMP       =  72.500 DegF"
+        chan.sendall.assert_called_with(b"read M:OUTTMP\n")
+        chan.close.assert_called()
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_concurrent_sessions(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        transport.open_session.side_effect = [
+            make_interactive_channel([b"\nACL> ", b"cmd1\n\noutput1\n\nACL> "]),
+            make_interactive_channel([b"\nACL> ", b"cmd2\n\noutput2\n\nACL> "]),
+        ]
+
+        async def run(cmd):
+            async with ssh.async_acl_session() as session:
+                return await session.send(cmd)
+
+        assert await asyncio.gather(run("cmd1"), run("cmd2")) == ["output1", "output2"]
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_wakes_on_channel_readable(self, mock_connect, mock_transport_cls):
+        """The prompt wait resumes when the channel fd signals, not after a full poll."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> "])
+        reader, writer = socket.socketpair()
+        chan.fileno.return_value = reader.fileno()
+        transport.open_session.return_value = chan
+
+        session = AsyncACLSession(ssh)
+        await session.open()
+
+        pending = []
+        chan.recv_ready = MagicMock(side_effect=lambda: bool(pending))
+        chan.recv = MagicMock(side_effect=lambda size: pending.pop(0))
+
+        def respond():
+            pending.append(b"cmd\n\nresult\n\nACL> ")
+            writer.send(b"x")
+
+        asyncio.get_running_loop().call_later(0.01, respond)
+        try:
+            assert await session.send("cmd", timeout=1.0) == "result"
+        finally:
+            await session.close()
+            reader.close()
+            writer.close()
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_timeout_waiting_for_prompt(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([])
+        transport.open_session.return_value = chan
+
+        session = AsyncACLSession(ssh, timeout=0.1)
+        with pytest.raises(ACLError, match="Timed out"):
+            await session.open()
+        assert session._closed
+        chan.close.assert_called()
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_open_applies_channel_timeout(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> "])
+        transport.open_session.return_value = chan
+
+        async with AsyncACLSession(ssh, timeout=7.0):
+            pass
+        chan.settimeout.assert_called_once_with(7.0)
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_send_writes_off_event_loop_thread(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> ", b"cmd\n\nresult\n\nACL> "])
+        send_threads = []
+        chan.sendall = MagicMock(side_effect=lambda data: send_threads.append(threading.get_ident()))
+        transport.open_session.return_value = chan
+
+        async with AsyncACLSession(ssh) as session:
+            assert await session.send("cmd") == "result"
+        assert len(send_threads) == 1
+        assert send_threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_send_failure_raises_acl_error(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> "])
+        chan.sendall = MagicMock(side_effect=socket.timeout("window full"))
+        transport.open_session.return_value = chan
+
+        async with AsyncACLSession(ssh) as session:
+            with pytest.raises(ACLError, match="window full"):
+                await session.send("cmd")
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_prompt_wait_after_eof_does_not_spin(self, mock_connect, mock_transport_cls):
+        """After EOF the fd stays readable with no data; the wait must still sleep."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_eof_channel(b"partial")
+        transport.open_session.return_value = chan
+
+        session = AsyncACLSession(ssh, timeout=0.3)
+        with pytest.raises(ACLError, match="Timed out"):
+            await session.open()
+        assert chan.recv_ready.call_count <= 30
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_buffer_bounded_without_prompt(self, mock_connect, mock_transport_cls):
+        """Output that never reaches a prompt cannot grow the buffer without limit."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"x" * 1024] * 8)
+        transport.open_session.return_value = chan
+
+        session = AsyncACLSession(ssh)
+        with patch.object(RemoteProcess, "_MAX_BUF", 4096):
+            with pytest.raises(ACLError, match="Buffer exceeded 4096 bytes"):
+                await session.open()
+        assert session._closed
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_process_exit_raises(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"\nACL> "])
+        transport.open_session.return_value = chan
+
+        async with AsyncACLSession(ssh) as session:
+            chan.exit_status_ready = MagicMock(return_value=True)
+            with pytest.raises(ACLError, match="Process exited"):
+                await session.send("read M:OUTTMP")
+
+    @pytest.mark.asyncio
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    async def test_send_before_open_or_after_close_raises(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        transport.open_session.return_value = make_interactive_channel([b"\nACL> "])
+
+        session = AsyncACLSession(ssh)
+        with pytest.raises(ACLError, match="not open"):
+            await session.send("read M:OUTTMP")
+        await session.open()
+        await session.close()
+        await session.close()  # idempotent
+        with pytest.raises(ACLError, match="closed"):
+            await session.send("read M:OUTTMP")
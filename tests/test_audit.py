@@ -1,6 +1,7 @@
 """Tests for AuditLog — structured JSON + tagged binary protobuf logging."""
 
 import json
+import time
 
 import pytest
 
@@ -44,8 +45,7 @@ def _ctx(
 
 def _read_jsonl(path):
     """Read JSON lines file, return list of dicts."""
-    lines = path.read_text().strip().split("\n")
-    return [json.loads(line) for line in lines]
+    return [json.loads(line) for line in path.read_bytes().splitlines() if line]
 
 
 # ── JSON output ──────────────────────────────────────────────────────────
@@ -155,6 +155,19 @@ class TestAuditLogJSON:
         entries = _read_jsonl(path)
         assert "final_drfs" not in entries[0]
 
+    def test_no_final_drfs_when_equal_copy(self, tmp_path):
+        """A rebuilt ctx with an equal DRF list is not reported as modified."""
+        path = tmp_path / "audit.jsonl"
+        audit = AuditLog(str(path))
+        original = _ctx(drfs=["M:OUTTMP", "G:AMANDA"])
+        rebuilt = _ctx(drfs=["M:OUTTMP", "G:AMANDA"])
+        decision = PolicyDecision(allowed=True, ctx=rebuilt)
+        audit.log_request(original, decision)
+        audit.close()
+
+        entries = _read_jsonl(path)
+        assert "final_drfs" not in entries[0]
+
     def test_no_final_drfs_when_denied(self, tmp_path):
         """Denied requests never have final_drfs (never reach backend)."""
         path = tmp_path / "audit.jsonl"
@@ -177,6 +190,37 @@ class TestAuditLogJSON:
         assert seq2 == seq1 + 1
         audit.close()
 
+    def test_stdlib_json_fallback(self, tmp_path, monkeypatch):
+        """Without orjson installed, entries are encoded with the json module."""
+        import pacsys.supervised._audit as audit_mod
+
+        monkeypatch.setattr(audit_mod, "orjson", None)
+        path = tmp_path / "audit.jsonl"
+        audit = AuditLog(str(path))
+        ctx = _ctx(drfs=["M:OUTTMP", "G:AMANDA"])
+        decision = PolicyDecision(allowed=False, reason="blocked")
+        audit.log_request(ctx, decision)
+        audit.close()
+
+        entries = _read_jsonl(path)
+        assert entries[0]["drfs"] == ["M:OUTTMP", "G:AMANDA"]
+        assert entries[0]["reason"] == "blocked"
+
+    def test_reused_ctx_logs_current_drfs(self, tmp_path):
+        """Entries reflect the ctx at log time, even when the same ctx is reused."""
+        path = tmp_path / "audit.jsonl"
+        audit = AuditLog(str(path))
+        ctx = _ctx(drfs=["M:OUTTMP"])
+        decision = PolicyDecision(allowed=False, reason="blocked")
+        audit.log_request(ctx, decision)
+        ctx.drfs.append("G:AMANDA")
+        audit.log_request(ctx, decision)
+        audit.close()
+
+        entries = _read_jsonl(path)
+        assert entries[0]["drfs"] == ["M:OUTTMP"]
+        assert entries[1]["drfs"] == ["M:OUTTMP", "G:AMANDA"]
+
     def test_timestamp_present(self, tmp_path):
         path = tmp_path / "audit.jsonl"
         audit = AuditLog(str(path))
@@ -190,10 +234,42 @@ class TestAuditLogJSON:
         # ISO format with timezone
         assert "T" in entries[0]["ts"]
 
+    def test_timestamp_matches_isoformat(self, tmp_path):
+        from datetime import datetime, timedelta, timezone
+
+        path = tmp_path / "audit.jsonl"
+        audit = AuditLog(str(path))
+        ctx = _ctx()
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+        before = datetime.now(timezone.utc)
+        audit.log_request(ctx, decision)
+        audit.log_request(ctx, decision)
+        after = datetime.now(timezone.utc)
+        audit.close()
+
+        for entry in _read_jsonl(path):
+            ts = datetime.fromisoformat(entry["ts"])
+            assert ts.utcoffset() == timedelta(0)
+            assert entry["ts"] == ts.isoformat(timespec="microseconds")
+            assert before - timedelta(seconds=1) <= ts <= after + timedelta(seconds=1)
+
 
 # ── Binary protobuf output ───────────────────────────────────────────────
 
 
+def _decode_varint(raw, pos):
+    """Reference byte-at-a-time varint decoder, return (value, new_pos)."""
+    value = 0
+    shift = 0
+    while True:
+        b = raw[pos]
+        pos += 1
+        value |= (b & 0x7F) << shift
+        if not (b & 0x80):
+            return value, pos
+        shift += 7
+
+
 def _read_tagged_protos(path):
     """Read tagged length-delimited protobuf file, return [(tag, data), ...]."""
     raw = path.read_bytes()
@@ -202,16 +278,7 @@ def _read_tagged_protos(path):
     while pos < len(raw):
         tag = raw[pos]
         pos += 1
-        # Decode varint
-        length = 0
-        shift = 0
-        while True:
-            b = raw[pos]
-            pos += 1
-            length |= (b & 0x7F) << shift
-            if not (b & 0x80):
-                break
-            shift += 7
+        length, pos = _decode_varint(raw, pos)
         data = raw[pos : pos + length]
         pos += length
         entries.append((tag, data))
@@ -234,6 +301,35 @@ class TestAuditLogProto:
         assert len(entries) == 1
         assert entries[0] == (TAG_READ_REQUEST, payload)
 
+    def test_proto_file_readable_before_close(self, tmp_path):
+        """A live file holds exactly the flushed records, with no padding, so it can be tailed."""
+        json_path = tmp_path / "audit.jsonl"
+        proto_path = tmp_path / "audit.binpb"
+        audit = AuditLog(str(json_path), proto_path=str(proto_path))
+        payload = b"\x08\x01"
+        ctx = _ctx(raw_request=_FakeProto(payload))
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+        audit.log_request(ctx, decision)
+        audit.log_request(ctx, decision)
+
+        record = bytes([TAG_READ_REQUEST, len(payload)]) + payload
+        assert proto_path.read_bytes() == record * 2
+        audit.close()
+
+    @pytest.mark.parametrize("size", [0, 127, 128, 20000])
+    def test_payload_length_framing(self, tmp_path, size):
+        json_path = tmp_path / "audit.jsonl"
+        proto_path = tmp_path / "audit.binpb"
+        audit = AuditLog(str(json_path), proto_path=str(proto_path))
+        payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        ctx = _ctx(raw_request=_FakeProto(payload))
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+        audit.log_request(ctx, decision)
+        audit.log_request(ctx, decision)
+        audit.close()
+
+        assert _read_tagged_protos(proto_path) == [(TAG_READ_REQUEST, payload)] * 2
+
     def test_set_request_tag(self, tmp_path):
         json_path = tmp_path / "audit.jsonl"
         proto_path = tmp_path / "audit.binpb"
@@ -304,6 +400,28 @@ class TestAuditLogProto:
         # Proto file not created (no serializable data)
         assert not proto_path.exists()
 
+    def test_non_serializable_response_skipped_in_proto(self, tmp_path):
+        json_path = tmp_path / "audit.jsonl"
+        proto_path = tmp_path / "audit.binpb"
+        audit = AuditLog(str(json_path), proto_path=str(proto_path), log_responses=True)
+        audit.log_response(1, "ipv4:127.0.0.1:9999", "Read", None)
+        audit.close()
+
+        assert [e["dir"] for e in _read_jsonl(json_path)] == ["out"]
+        assert not proto_path.exists()
+
+    def test_unknown_method_tag_raises(self, tmp_path):
+        json_path = tmp_path / "audit.jsonl"
+        proto_path = tmp_path / "audit.binpb"
+        audit = AuditLog(str(json_path), proto_path=str(proto_path), log_responses=True)
+        ctx = _ctx(rpc_method="Alarm", raw_request=_FakeProto(b"\x01"))
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+        with pytest.raises(ValueError, match="Alarm"):
+            audit.log_request(ctx, decision)
+        with pytest.raises(ValueError, match="Alarm"):
+            audit.log_response(1, ctx.peer, "Alarm", _FakeProto(b"\x02"))
+        audit.close()
+
     def test_response_not_written_when_disabled(self, tmp_path):
         json_path = tmp_path / "audit.jsonl"
         proto_path = tmp_path / "audit.binpb"
@@ -337,6 +455,45 @@ class TestAuditLogLifecycle:
         assert audit._writes_since_flush == 0  # flushed
         audit.close()
 
+    def test_batched_records_written_on_flush(self, tmp_path):
+        path = tmp_path / "audit.jsonl"
+        proto_path = tmp_path / "audit.binpb"
+        audit = AuditLog(str(path), proto_path=str(proto_path), flush_interval=2)
+        ctx = _ctx(raw_request=_FakeProto(b"\x01\x02"))
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+
+        audit.log_request(ctx, decision)
+        assert path.read_bytes() == b""
+        assert proto_path.read_bytes() == b""
+
+        audit.log_request(ctx, decision)
+        assert len(_read_jsonl(path)) == 2
+        assert len(_read_tagged_protos(proto_path)) == 2
+        audit.close()
+
+    @pytest.mark.parametrize("writev", ["missing", "short"])
+    def test_flush_without_full_writev(self, tmp_path, monkeypatch, writev):
+        """Records survive platforms without writev() and short gathered writes."""
+        import os
+
+        import pacsys.supervised._audit as audit_mod
+
+        if writev == "missing":
+            monkeypatch.setattr(audit_mod, "_writev", None)
+        else:
+            monkeypatch.setattr(audit_mod, "_writev", lambda fd, bufs: os.write(fd, bytes(bufs[0][:1])))
+        path = tmp_path / "audit.jsonl"
+        proto_path = tmp_path / "audit.binpb"
+        audit = AuditLog(str(path), proto_path=str(proto_path), flush_interval=2)
+        ctx = _ctx(raw_request=_FakeProto(b"\x01\x02"))
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+        audit.log_request(ctx, decision)
+        audit.log_request(ctx, decision)
+        audit.close()
+
+        assert [e["seq"] for e in _read_jsonl(path)] == [1, 2]
+        assert _read_tagged_protos(proto_path) == [(TAG_READ_REQUEST, b"\x01\x02")] * 2
+
     def test_close_flushes_pending(self, tmp_path):
         path = tmp_path / "audit.jsonl"
         audit = AuditLog(str(path), flush_interval=100)
@@ -349,6 +506,92 @@ class TestAuditLogLifecycle:
         entries = _read_jsonl(path)
         assert len(entries) == 1
 
+    def test_background_writer(self, tmp_path, monkeypatch):
+        import threading
+
+        import pacsys.supervised._audit as audit_mod
+
+        threads = []
+        real_write_all = audit_mod._write_all
+
+        def recording_write_all(fd, chunks):
+            threads.append(threading.current_thread().name)
+            real_write_all(fd, chunks)
+
+        monkeypatch.setattr(audit_mod, "_write_all", recording_write_all)
+        path = tmp_path / "audit.jsonl"
+        proto_path = tmp_path / "audit.binpb"
+        audit = AuditLog(str(path), proto_path=str(proto_path), background=True)
+        ctx = _ctx(raw_request=_FakeProto(b"\x01"))
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+        for _ in range(5):
+            audit.log_request(ctx, decision)
+        audit.close()
+
+        assert [e["seq"] for e in _read_jsonl(path)] == [1, 2, 3, 4, 5]
+        assert len(_read_tagged_protos(proto_path)) == 5
+        assert threads and set(threads) == {"pacsys-audit-writer"}
+        assert audit._writer is None
+
+    def test_background_queue_is_bounded(self, tmp_path, monkeypatch):
+        """A stalled writer blocks logging once the queue is full instead of growing it."""
+        import threading
+
+        import pacsys.supervised._audit as audit_mod
+
+        release = threading.Event()
+        real_write_all = audit_mod._write_all
+
+        def stalled_write_all(fd, chunks):
+            release.wait(5.0)
+            real_write_all(fd, chunks)
+
+        monkeypatch.setattr(audit_mod, "_write_all", stalled_write_all)
+        monkeypatch.setattr(audit_mod, "_BACKGROUND_QUEUE_MAXSIZE", 1)
+        path = tmp_path / "audit.jsonl"
+        audit = AuditLog(str(path), background=True)
+        ctx = _ctx()
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+
+        def log_many():
+            for _ in range(4):
+                audit.log_request(ctx, decision)
+
+        producer = threading.Thread(target=log_many)
+        producer.start()
+        producer.join(0.3)
+        # One batch in the writer, one queued: the producer is held back
+        assert producer.is_alive()
+        assert audit._queue.qsize() == 1
+        release.set()
+        producer.join(5.0)
+        assert not producer.is_alive()
+        audit.close()
+        assert [e["seq"] for e in _read_jsonl(path)] == [1, 2, 3, 4]
+
+    def test_background_write_error_reraised(self, tmp_path, monkeypatch):
+        import pacsys.supervised._audit as audit_mod
+
+        def failing_write_all(fd, chunks):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(audit_mod, "_write_all", failing_write_all)
+        audit = AuditLog(str(tmp_path / "audit.jsonl"), background=True)
+        ctx = _ctx()
+        decision = PolicyDecision(allowed=True, ctx=ctx)
+        audit.log_request(ctx, decision)
+        deadline = time.monotonic() + 5.0
+        while audit._writer_exc is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        with pytest.raises(OSError, match="disk full"):
+            audit.log_request(ctx, decision)
+        # Reported once; the next failure surfaces on close()
+        audit.log_request(ctx, decision)
+        with pytest.raises(OSError, match="disk full"):
+            audit.close()
+        audit.close()
+
     def test_close_idempotent(self, tmp_path):
         path = tmp_path / "audit.jsonl"
         audit = AuditLog(str(path))
@@ -387,3 +630,30 @@ class TestEncodeVarint:
         buf = bytearray()
         _encode_varint(buf.extend, 0)
         assert buf == bytes([0])
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (127, bytes([0x7F])),
+            (128, bytes([0x80, 0x01])),
+            (16383, bytes([0xFF, 0x7F])),
+            (16384, bytes([0x80, 0x80, 0x01])),
+            (2**64 - 1, bytes([0xFF] * 9 + [0x01])),
+        ],
+    )
+    def test_length_boundaries(self, value, expected):
+        buf = bytearray()
+        _encode_varint(buf.extend, value)
+        assert buf == expected
+
+    def test_round_trip(self):
+        values = [0, 1, 127, 128, 255, 300, 16383, 16384, 2**21, 2**28 - 1, 2**35 + 5, 2**63, 2**64 - 1]
+        buf = bytearray()
+        for value in values:
+            _encode_varint(buf.extend, value)
+        pos = 0
+        decoded = []
+        while pos < len(buf):
+            value, pos = _decode_varint(buf, pos)
+            decoded.append(value)
+        assert decoded == values
@@ -1,15 +1,20 @@
 """Tests for pacsys.cli.info -- acinfo / pacsys-info CLI tool."""
 
 import contextlib
+import functools
 import io
 import json
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 from unittest import mock
 
 from pacsys.digital_status import DigitalStatus, StatusBit
 from pacsys.types import DeviceMeta, Reading, ValueType
 
 
+# Reading, DeviceMeta and DigitalStatus are frozen, so tests can share instances.
+@functools.lru_cache(maxsize=None)
 def _make_reading(
     drf="M:OUTTMP",
     value=72.5,
@@ -29,6 +34,7 @@ def _make_reading(
     )
 
 
+@functools.lru_cache(maxsize=None)
 def _make_digital_status(device="M:OUTTMP"):
     return DigitalStatus(
         device=device,
@@ -51,6 +57,54 @@ def _make_digital_status(device="M:OUTTMP"):
     )
 
 
+@dataclass(slots=True)
+class _MockDeviceConfig:
+    """Values returned by every _MockDevice built from one factory call."""
+
+    description: str
+    reading: Reading
+    setting: Reading
+    analog_alarm: dict
+    status: dict
+    digital_status: DigitalStatus
+    digital_alarm: dict
+    description_error: Optional[BaseException] = None
+
+
+class _MockDevice:
+    """Stand-in for pacsys.device.Device driven by a _MockDeviceConfig."""
+
+    __slots__ = ("name", "_backend", "_config")
+
+    def __init__(self, name, backend=None, *, config):
+        self.name = name
+        self._backend = backend
+        self._config = config
+
+    def description(self, **kw):
+        if self._config.description_error:
+            raise self._config.description_error
+        return self._config.description
+
+    def get(self, **kw):
+        prop = kw.get("prop")
+        if prop == "setting":
+            return self._config.setting
+        return self._config.reading
+
+    def analog_alarm(self, **kw):
+        return self._config.analog_alarm
+
+    def status(self, **kw):
+        return self._config.status
+
+    def digital_status(self, **kw):
+        return self._config.digital_status
+
+    def digital_alarm(self, **kw):
+        return self._config.digital_alarm
+
+
 def _mock_device_factory(
     description="Outside temperature",
     reading=None,
@@ -61,7 +115,7 @@ def _mock_device_factory(
     digital_alarm=None,
     description_error=None,
 ):
-    """Create a mock Device class that returns configured values."""
+    """Create a mock Device constructor that returns configured values."""
     if reading is None:
         reading = _make_reading()
     if setting is None:
@@ -75,38 +129,20 @@ def _mock_device_factory(
     if digital_alarm is None:
         digital_alarm = {"nominal": 0b10110000, "mask": 0b11110000}
 
-    class MockDevice:
-        def __init__(self, name, backend=None):
-            self.name = name
-            self._backend = backend
-
-        def description(self, **kw):
-            if description_error:
-                raise description_error
-            return description
-
-        def get(self, **kw):
-            prop = kw.get("prop")
-            if prop == "setting":
-                return setting
-            return reading
-
-        def analog_alarm(self, **kw):
-            return analog_alarm
-
-        def status(self, **kw):
-            return status
-
-        def digital_status(self, **kw):
-            return digital_status
-
-        def digital_alarm(self, **kw):
-            return digital_alarm
-
-    return MockDevice
+    config = _MockDeviceConfig(
+        description=description,
+        reading=reading,
+        setting=setting,
+        analog_alarm=analog_alarm,
+        status=status,
+        digital_status=digital_status,
+        digital_alarm=digital_alarm,
+        description_error=description_error,
+    )
+    return functools.partial(_MockDevice, config=config)
 
 
-def _run(args, mock_device_cls, *, devdb_return=None):
+def _run(monkeypatch, args, mock_device_cls, *, devdb_return=None):
     """Run acinfo main() with mocked backend and Device.
 
     If devdb_return is given, _get_devdb is mocked to return it.
@@ -114,27 +150,25 @@ def _run(args, mock_device_cls, *, devdb_return=None):
     """
     from pacsys.cli.info import main
 
+    monkeypatch.setattr("pacsys.cli.info.make_backend", lambda *a, **kw: mock.MagicMock())
+    monkeypatch.setattr("pacsys.cli.info.Device", mock_device_cls)
+    monkeypatch.setattr("pacsys.cli.info._get_devdb", lambda *a, **kw: devdb_return)
+    monkeypatch.setattr("sys.argv", ["acinfo", *args])
     out = io.StringIO()
     err = io.StringIO()
-    with mock.patch("pacsys.cli.info.make_backend") as mb:
-        backend = mock.MagicMock()
-        mb.return_value = backend
-        with mock.patch("pacsys.cli.info.Device", mock_device_cls):
-            with mock.patch("pacsys.cli.info._get_devdb", return_value=devdb_return):
-                with mock.patch("sys.argv", ["acinfo"] + args):
-                    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
-                        try:
-                            rc = main()
-                        except SystemExit as e:
-                            rc = e.code
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = main()
+        except SystemExit as e:
+            rc = e.code
     return rc, out.getvalue(), err.getvalue()
 
 
 class TestBasicInfo:
     """Shows device name, description, and key sections."""
 
-    def test_basic_info(self):
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory())
+    def test_basic_info(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory())
         assert rc == 0
         assert "M:OUTTMP" in out
         assert "Outside temperature" in out
@@ -146,8 +180,8 @@ class TestBasicInfo:
 class TestVerboseShowsBits:
     """Verbose mode shows per-bit digital status."""
 
-    def test_verbose_shows_bits(self):
-        rc, out, _ = _run(["-v", "M:OUTTMP"], _mock_device_factory())
+    def test_verbose_shows_bits(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["-v", "M:OUTTMP"], _mock_device_factory())
         assert rc == 0
         assert "Bit 0" in out
         assert "Bit 1" in out
@@ -158,8 +192,8 @@ class TestVerboseShowsBits:
 class TestCompactShowsBitfield:
     """Default mode shows binary bitfield string for digital status."""
 
-    def test_compact_shows_bitfield(self):
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory())
+    def test_compact_shows_bitfield(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory())
         assert rc == 0
         # Bits 0-7: is_set = T,T,F,F,T,T,F,T -> MSB-first "10110011"
         assert "10110011" in out
@@ -169,8 +203,8 @@ class TestCompactShowsBitfield:
 class TestJsonOutput:
     """JSON output contains structured data with digital_status array."""
 
-    def test_json_output(self):
-        rc, out, _ = _run(["--format", "json", "M:OUTTMP"], _mock_device_factory())
+    def test_json_output(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["--format", "json", "M:OUTTMP"], _mock_device_factory())
         assert rc == 0
         data = json.loads(out.strip())
         assert data["device"] == "M:OUTTMP"
@@ -187,27 +221,27 @@ class TestJsonOutput:
 class TestConnectionError:
     """Connection error produces exit code 2."""
 
-    def test_connection_error(self):
+    def test_connection_error(self, monkeypatch):
         from pacsys.cli.info import main
 
+        monkeypatch.setattr("pacsys.cli.info.make_backend", mock.Mock(side_effect=Exception("connection refused")))
+        monkeypatch.setattr("sys.argv", ["acinfo", "M:OUTTMP"])
         out = io.StringIO()
         err = io.StringIO()
-        with mock.patch("pacsys.cli.info.make_backend", side_effect=Exception("connection refused")):
-            with mock.patch("sys.argv", ["acinfo", "M:OUTTMP"]):
-                with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
-                    try:
-                        rc = main()
-                    except SystemExit as e:
-                        rc = e.code
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                rc = main()
+            except SystemExit as e:
+                rc = e.code
         assert rc == 2
 
 
 class TestErrorInline:
     """When a section raises, show [ERROR] inline instead of aborting."""
 
-    def test_error_inline(self):
+    def test_error_inline(self, monkeypatch):
         factory = _mock_device_factory(description_error=RuntimeError("device offline"))
-        rc, out, _ = _run(["M:OUTTMP"], factory)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], factory)
         assert rc == 1, "section error should produce exit code 1"
         assert "[ERROR]" in out
         assert "device offline" in out
@@ -218,28 +252,28 @@ class TestErrorInline:
 class TestExitCodeOnError:
     """Exit code 1 when any section has an error."""
 
-    def test_text_exit_code_on_section_error(self):
+    def test_text_exit_code_on_section_error(self, monkeypatch):
         factory = _mock_device_factory(description_error=RuntimeError("boom"))
-        rc, out, _ = _run(["M:OUTTMP"], factory)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], factory)
         assert rc == 1
 
-    def test_json_exit_code_on_section_error(self):
+    def test_json_exit_code_on_section_error(self, monkeypatch):
         factory = _mock_device_factory(description_error=RuntimeError("boom"))
-        rc, out, _ = _run(["--format", "json", "M:OUTTMP"], factory)
+        rc, out, _ = _run(monkeypatch, ["--format", "json", "M:OUTTMP"], factory)
         assert rc == 1
         data = json.loads(out.strip())
         assert data["description"] == {"error": "boom"}
 
-    def test_no_error_exit_code_zero(self):
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory())
+    def test_no_error_exit_code_zero(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory())
         assert rc == 0
 
 
 class TestMultipleDevices:
     """Two devices are separated by a blank line."""
 
-    def test_multiple_devices(self):
-        rc, out, _ = _run(["M:OUTTMP", "G:AMANDA"], _mock_device_factory())
+    def test_multiple_devices(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP", "G:AMANDA"], _mock_device_factory())
         assert rc == 0
         assert "M:OUTTMP" in out
         assert "G:AMANDA" in out
@@ -282,24 +316,24 @@ def _make_mock_devdb(*, has_reading=True, has_setting=True, has_status=True):
 class TestDevDBPropertyFiltering:
     """DevDB-aware property filtering skips sections for unsupported properties."""
 
-    def test_read_only_device_skips_setting(self):
+    def test_read_only_device_skips_setting(self, monkeypatch):
         devdb = _make_mock_devdb(has_setting=False)
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
         assert rc == 0
         assert "Reading" in out
         assert "Setting" not in out
 
-    def test_no_status_skips_status_and_digital_status(self):
+    def test_no_status_skips_status_and_digital_status(self, monkeypatch):
         devdb = _make_mock_devdb(has_status=False)
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
         assert rc == 0
         assert "Status" not in out
         assert "Digital status" not in out
 
-    def test_read_only_sensor_skips_setting_and_status(self):
+    def test_read_only_sensor_skips_setting_and_status(self, monkeypatch):
         """DevDB filters reading/setting/status; alarms always attempted."""
         devdb = _make_mock_devdb(has_setting=False, has_status=False)
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
         assert rc == 0
         assert "Description" in out
         assert "Reading" in out
@@ -310,9 +344,9 @@ class TestDevDBPropertyFiltering:
         assert "Analog alarm" in out
         assert "Digital alarm" in out
 
-    def test_json_omits_absent_properties(self):
+    def test_json_omits_absent_properties(self, monkeypatch):
         devdb = _make_mock_devdb(has_setting=False, has_status=False)
-        rc, out, _ = _run(["--format", "json", "M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
+        rc, out, _ = _run(monkeypatch, ["--format", "json", "M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
         assert rc == 0
         data = json.loads(out.strip())
         assert "reading" in data
@@ -320,9 +354,9 @@ class TestDevDBPropertyFiltering:
         assert "status" not in data
         assert "digital_status" not in data
 
-    def test_no_devdb_queries_everything(self):
+    def test_no_devdb_queries_everything(self, monkeypatch):
         """Without DevDB, all sections appear (fallback to current behavior)."""
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory(), devdb_return=None)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory(), devdb_return=None)
         assert rc == 0
         assert "Reading" in out
         assert "Setting" in out
@@ -331,10 +365,10 @@ class TestDevDBPropertyFiltering:
         assert "Analog alarm" in out
         assert "Digital alarm" in out
 
-    def test_exit_code_zero_when_props_skipped(self):
+    def test_exit_code_zero_when_props_skipped(self, monkeypatch):
         """Absent properties should NOT cause exit code 1."""
         devdb = _make_mock_devdb(has_setting=False, has_status=False)
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
         assert rc == 0
 
 
@@ -375,8 +409,8 @@ def _mock_noprop_device_factory():
 class TestNoPropSuppression:
     """DBM_NOPROP errors are hidden in non-verbose mode, shown in verbose mode."""
 
-    def test_noprop_hidden_without_verbose(self):
-        rc, out, _ = _run(["M:OUTTMP"], _mock_noprop_device_factory())
+    def test_noprop_hidden_without_verbose(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_noprop_device_factory())
         assert rc == 0
         assert "Setting" not in out
         assert "Status" not in out
@@ -387,8 +421,8 @@ class TestNoPropSuppression:
         assert "Reading" in out
         assert "Analog alarm" in out
 
-    def test_noprop_shown_with_verbose(self):
-        rc, out, _ = _run(["-v", "M:OUTTMP"], _mock_noprop_device_factory())
+    def test_noprop_shown_with_verbose(self, monkeypatch):
+        rc, out, _ = _run(monkeypatch, ["-v", "M:OUTTMP"], _mock_noprop_device_factory())
         assert rc == 0
         assert "Setting" in out
         assert "Status" in out
@@ -396,14 +430,14 @@ class TestNoPropSuppression:
         assert "Digital alarm" in out
         assert "DBM_NOPROP" in out
 
-    def test_noprop_exit_code_zero(self):
+    def test_noprop_exit_code_zero(self, monkeypatch):
         """DBM_NOPROP should not cause error exit code."""
-        rc, _, _ = _run(["M:OUTTMP"], _mock_noprop_device_factory())
+        rc, _, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_noprop_device_factory())
         assert rc == 0
 
-    def test_noprop_json_omits_keys(self):
+    def test_noprop_json_omits_keys(self, monkeypatch):
         """JSON output omits keys for DBM_NOPROP properties."""
-        rc, out, _ = _run(["--format", "json", "M:OUTTMP"], _mock_noprop_device_factory())
+        rc, out, _ = _run(monkeypatch, ["--format", "json", "M:OUTTMP"], _mock_noprop_device_factory())
         assert rc == 0
         data = json.loads(out.strip())
         assert "reading" in data
@@ -413,10 +447,10 @@ class TestNoPropSuppression:
         assert "digital_status" not in data
         assert "digital_alarm" not in data
 
-    def test_real_error_still_shown(self):
+    def test_real_error_still_shown(self, monkeypatch):
         """Non-NOPROP errors still show in non-verbose mode."""
         factory = _mock_device_factory(description_error=RuntimeError("device offline"))
-        rc, out, _ = _run(["M:OUTTMP"], factory)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], factory)
         assert rc == 1
         assert "[ERROR]" in out
         assert "device offline" in out
@@ -425,15 +459,15 @@ class TestNoPropSuppression:
 class TestDeviceIndex:
     """Device index is shown on the name line."""
 
-    def test_di_from_devdb(self):
+    def test_di_from_devdb(self, monkeypatch):
         devdb = _make_mock_devdb()
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
         assert rc == 0
         assert "M:OUTTMP (di=42)" in out
 
-    def test_di_from_backend_reading(self):
+    def test_di_from_backend_reading(self, monkeypatch):
         """When DevDB is unavailable, di comes from backend reading metadata."""
-        rc, out, _ = _run(["M:OUTTMP"], _mock_device_factory(), devdb_return=None)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], _mock_device_factory(), devdb_return=None)
         # _make_reading sets device_index=0 in meta, so no di shown (0 is falsy)
         assert "di=" not in out
 
@@ -451,18 +485,18 @@ class TestDeviceIndex:
             meta=meta_with_di,
         )
         factory = _mock_device_factory(reading=reading_with_di)
-        rc, out, _ = _run(["M:OUTTMP"], factory, devdb_return=None)
+        rc, out, _ = _run(monkeypatch, ["M:OUTTMP"], factory, devdb_return=None)
         assert rc == 0
         assert "M:OUTTMP (di=12345)" in out
 
-    def test_di_in_json_from_devdb(self):
+    def test_di_in_json_from_devdb(self, monkeypatch):
         devdb = _make_mock_devdb()
-        rc, out, _ = _run(["--format", "json", "M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
+        rc, out, _ = _run(monkeypatch, ["--format", "json", "M:OUTTMP"], _mock_device_factory(), devdb_return=devdb)
         data = json.loads(out.strip())
         assert data["device_index"] == 42
 
-    def test_no_di_without_devdb_or_meta(self):
+    def test_no_di_without_devdb_or_meta(self, monkeypatch):
         """No di key in JSON when neither DevDB nor meta has it."""
-        rc, out, _ = _run(["--format", "json", "M:OUTTMP"], _mock_device_factory(), devdb_return=None)
+        rc, out, _ = _run(monkeypatch, ["--format", "json", "M:OUTTMP"], _mock_device_factory(), devdb_return=None)
         data = json.loads(out.strip())
         assert "device_index" not in data
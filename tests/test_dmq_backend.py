@@ -25,6 +25,7 @@ from pika.adapters.select_connection import SelectConnection
 
 from pacsys.backends.dmq import (
     DMQBackend,
+    _DMQSubscriptionHandle,
     _reply_to_reading,
 )
 from pacsys.drf_utils import prepare_for_write
@@ -613,6 +614,47 @@ class TestDMQBackendSubscribe:
             assert len(readings_received) >= 1
             assert readings_received[0].value == TEMP_VALUE
 
+    def test_subscribe_single_index_skips_batch_dispatch(self):
+        """A reply for one subscribed DRF goes through _dispatch, not a one-item batch."""
+        replies = [make_double_reply(TEMP_VALUE + i, ref_id=1) for i in range(3)]
+        with (
+            _mock_dmq_backend(replies) as backend,
+            mock.patch.object(_DMQSubscriptionHandle, "_dispatch_many", autospec=True) as dispatch_many,
+        ):
+            handle = backend.subscribe([TEMP_DEVICE])
+            reading, _ = next(handle.readings(timeout=2.0))
+            handle.stop()
+        assert reading.value == TEMP_VALUE
+        dispatch_many.assert_not_called()
+
+    def test_subscribe_duplicate_drfs_delivered_as_batch(self):
+        """A reply for a DRF subscribed twice reaches both indices in order."""
+        replies = [make_double_reply(TEMP_VALUE, ref_id=1)]
+        with _mock_dmq_backend(replies) as backend:
+            handle = backend.subscribe([TEMP_DEVICE, TEMP_DEVICE])
+            received = []
+            for reading, _ in handle.readings(timeout=2.0):
+                received.append(reading)
+                if len(received) == 2:
+                    break
+            handle.stop()
+        assert [r.value for r in received] == [TEMP_VALUE, TEMP_VALUE]
+
+    def test_subscribe_interns_drfs(self):
+        """Subscriptions to the same DRF share one interned string for routing keys."""
+        drf_a = "".join(["M:OUTTMP", "@p,1000"])
+        drf_b = "".join(["M:OUTTMP@", "p,1000"])
+        assert drf_a is not drf_b
+        with _mock_dmq_backend([]) as backend:
+            h1 = backend.subscribe([drf_a])
+            h2 = backend.subscribe([drf_b])
+            subs = list(backend._subscriptions.values())
+            assert len(subs) == 2
+            assert subs[0].drfs[0] is subs[1].drfs[0]
+            assert next(iter(subs[0].drf_to_idx)) is subs[1].drfs[0]
+            h1.stop()
+            h2.stop()
+
     def test_subscribe_callback_mode(self):
         """Test subscribe with callback mode calls callback."""
         replies = [make_double_reply(TEMP_VALUE + i, ref_id=1) for i in range(2)]
@@ -170,6 +170,54 @@ def test_drf_parse(drf, expected_parts, expected_canonical, expected_qualified):
     assert result.to_qualified() == expected_qualified
 
 
+def test_parse_request_returns_independent_copies():
+    first = parse_request("M:OUTTMP@p,1000")
+    first.device = "Z:CHANGED"
+    second = parse_request("M:OUTTMP@p,1000")
+    assert second is not first
+    assert second.device == "M:OUTTMP"
+
+
+def test_parse_request_does_not_share_nested_objects():
+    first = parse_request("M:OUTTMP[0:10]@p,1000")
+    first.range.high = 99
+    first.event.freq = 5
+    second = parse_request("M:OUTTMP[0:10]@p,1000")
+    assert second.range is not first.range
+    assert second.range.high == 10
+    assert second.event is not first.event
+    assert second.event.freq == 1000
+    assert second.to_canonical() == "M:OUTTMP.READING[0:10]@p,1000"
+
+
+def test_rendered_strings_track_attribute_changes():
+    req = parse_request("M:OUTTMP@p,1000")
+    assert req.to_canonical() == "M:OUTTMP.READING@p,1000"
+    assert req.to_qualified() == "M:OUTTMP@p,1000"
+    req.property = DRF_PROPERTY.SETTING
+    req.field = DRF_FIELD.SCALED
+    req.event = ImmediateEvent()
+    assert req.to_canonical() == "M:OUTTMP.SETTING@I"
+    assert req.to_qualified() == "M_OUTTMP@I"
+    assert req.to_canonical(event=DefaultEvent()) == "M:OUTTMP.SETTING"
+
+
+def test_rendered_strings_track_in_place_range_and_event_changes():
+    req = parse_request("M:OUTTMP[0:10]@p,1000")
+    assert req.to_canonical() == "M:OUTTMP.READING[0:10]@p,1000"
+    assert req.to_qualified() == "M:OUTTMP[0:10]@p,1000"
+    req.range.high = 20
+    req.event.raw_string = "p,500"
+    assert req.to_canonical() == "M:OUTTMP.READING[0:20]@p,500"
+    assert req.to_qualified() == "M:OUTTMP[0:20]@p,500"
+
+
+def test_parse_request_invalid_raises_every_time():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse_request("M:OUTTMP<-FTP<-FTP")
+
+
 @pytest.mark.parametrize(
     "drf,expected_canonical",
     [
@@ -187,6 +235,24 @@ def test_get_qualified_device():
     assert get_qualified_device("N:I2B1RI", DRF_PROPERTY.SETTING) == "N_I2B1RI"
 
 
+@pytest.mark.parametrize(
+    "device,prop,expected",
+    [
+        ("N_I2B1RI", DRF_PROPERTY.READING, "N:I2B1RI"),
+        ("M:OUTTMP", DRF_PROPERTY.STATUS, "M|OUTTMP"),
+        ("M|OUTTMP", DRF_PROPERTY.ALARM_LIST_NAME, "M!OUTTMP"),
+        ("Z:A", DRF_PROPERTY.DESCRIPTION, "Z~A"),
+    ],
+)
+def test_get_qualified_device_replaces_qualifier(device, prop, expected):
+    assert get_qualified_device(device, prop) == expected
+
+
+def test_get_qualified_device_rejects_bit_status():
+    with pytest.raises(ValueError, match="no qualifier"):
+        get_qualified_device("M:OUTTMP", DRF_PROPERTY.BIT_STATUS)
+
+
 @pytest.mark.parametrize(
     "drf,expected",
     [
@@ -198,6 +264,11 @@ def test_get_qualified_device():
         ("M:OUTTMP@I", "M:OUTTMP@I"),
         ("M:OUTTMP<-FTP", "M:OUTTMP@I<-FTP"),
         ("M:OUTTMP@p,100H<-FTP", "M:OUTTMP@p,100H<-FTP"),
+        ("M@OUTTMP", "M@OUTTMP@I"),  # '@' qualifier (ANALOG) is not an event
+        ("M@OUTTMP@p,1000", "M@OUTTMP@p,1000"),
+        ("M:OUTTMP@U", "M:OUTTMP@I"),
+        ("M:OUTTMP@u<-FTP", "M:OUTTMP@I<-FTP"),
+        ("M:OUTTMP<-LOGGER:1:2", "M:OUTTMP<-LOGGER:1:2"),  # logger extras never get @I
     ],
 )
 def test_ensure_immediate_event(drf, expected):
@@ -225,3 +296,28 @@ def test_parse_time_freq(raw, expected_ms):
     from pacsys.drf3.event import _parse_time_freq
 
     assert _parse_time_freq(raw) == expected_ms
+
+
+@pytest.mark.parametrize(
+    "unit,to_ms",
+    [("U", lambda n: n / 1000), ("H", lambda n: 1000 / n), ("K", lambda n: 1000 / (n * 1000))],
+)
+def test_parse_time_freq_matches_float_java_round(unit, to_ms):
+    """Integer rounding agrees with Java's floor(x + 0.5) on doubles."""
+    import math
+
+    from pacsys.drf3.event import _parse_time_freq
+
+    for num in range(1, 5001):
+        assert _parse_time_freq(f"{num}{unit}") == math.floor(to_ms(num) + 0.5), num
+
+
+@pytest.mark.parametrize("prop", [p for p in DRF_PROPERTY if p.value is not None])
+def test_qualifier_char_selects_default_property(prop):
+    assert parse_request(f"M{prop.value}OUTTMP").property is prop
+    assert parse_request(f"M{prop.value}OUTTMP").property_explicit is False
+
+
+@pytest.mark.parametrize("drf", ["G:AMANDA", "Z-ACLTST", "MXOUTTMP"])
+def test_unqualified_defaults_to_reading(drf):
+    assert parse_request(drf).property is DRF_PROPERTY.READING
@@ -5,9 +5,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pacsys.ssh import RemoteProcess, SSHError, SSHTimeoutError
+from pacsys.ssh import RemoteProcess, SSHError, SSHTimeoutError, _marker_pattern
 
-from .ssh_helpers import connected_ssh, make_interactive_channel
+from .ssh_helpers import connected_ssh, idle_fileno, make_eof_channel, make_interactive_channel
 
 
 @pytest.fixture(autouse=True)
@@ -16,14 +16,24 @@ def _mock_getuser():
         yield
 
 
+@pytest.fixture
+def mock_transport_cls():
+    with patch("paramiko.Transport") as transport_cls:
+        yield transport_cls
+
+
+@pytest.fixture
+def mock_connect():
+    with patch("socket.create_connection") as connect:
+        yield connect
+
+
 # ---------------------------------------------------------------------------
 # RemoteProcess
 # ---------------------------------------------------------------------------
 
 
 class TestRemoteProcess:
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_send_line(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([])
@@ -34,8 +44,6 @@ class TestRemoteProcess:
         chan.sendall.assert_called_with(b"hello\n")
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_send_bytes(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([])
@@ -46,8 +54,6 @@ class TestRemoteProcess:
         chan.sendall.assert_called_with(b"\x00\x01\x02")
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_read_until_finds_marker(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([b"hello\nMARKER", b"extra"])
@@ -58,8 +64,6 @@ class TestRemoteProcess:
         assert result == b"hello\n"
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_read_until_consumes_marker(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([b"aMARKERbMARKERc"])
@@ -72,8 +76,32 @@ class TestRemoteProcess:
         assert r2 == b"b"
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
+    def test_read_until_serves_leftover_without_recv(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"aMARKERbMARKERtail", b"more"])
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_until(b"MARKER") == b"a"
+        assert proc.read_until(b"MARKER") == b"b"
+        assert chan.recv.call_count == 1
+        assert proc.read_for(0.05) == b"tailmore"
+        proc.close()
+
+    def test_read_until_returns_bytes_and_releases_buffer(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"MARKER" + b"x" * 100_000 + b"MARKER", b"next"])
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_until(b"MARKER") == b""
+        result = proc.read_until(b"MARKER")
+        assert type(result) is bytes
+        assert result == b"x" * 100_000
+        # Buffer must still be resizable (no lingering memoryview export)
+        assert proc.read_for(0.05) == b"next"
+        proc.close()
+
     def test_read_until_split_across_chunks(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([b"hel", b"lo\nMAR", b"KER"])
@@ -84,12 +112,88 @@ class TestRemoteProcess:
         assert result == b"hello\n"
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
+    def test_read_until_marker_split_over_many_chunks(self, mock_connect, mock_transport_cls):
+        """Incremental scan must rewind far enough to catch a marker split byte by byte."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"out", b"M", b"A", b"R", b"K", b"E", b"Rtail"])
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_until(b"MARKER") == b"out"
+        assert proc.read_for(0.05) == b"tail"
+        proc.close()
+
+    def test_read_until_returns_first_marker_not_last(self, mock_connect, mock_transport_cls):
+        """A chunk ending in the marker may still hold an earlier one (batched responses)."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"one\nACL> two\nACL> "])
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_until(b"\nACL> ") == b"one"
+        assert proc.read_until(b"\nACL> ") == b"two"
+        proc.close()
+
+    def test_read_until_any_earliest_marker_wins(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"outERR: boom\n> ", b"done> "])
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_until_any([b"> ", b"ERR: "]) == (b"out", 1)
+        assert proc.read_until_any([b"> ", b"ERR: "]) == (b"boom\n", 0)
+        assert proc.read_until_any([b"> ", b"ERR: "]) == (b"done", 0)
+        proc.close()
+
+    def test_read_until_any_tie_prefers_first_listed(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"xPROMPT>y"])
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_until_any([b"PROMPT", b"PROMPT>"]) == (b"x", 0)
+        assert proc.read_until_any([b"y", b"y"]) == (b">", 0)
+        proc.close()
+
+    def test_read_until_any_split_across_chunks(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"data.*MA", b"RK", b"ER|rest"])
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        # Markers are matched literally, not as regular expressions
+        assert proc.read_until_any([b"MARKER|", b"."]) == (b"data", 1)
+        assert proc.read_until_any([b"MARKER|", b"*"]) == (b"", 1)
+        assert proc.read_until_any([b"MARKER|"]) == (b"", 0)
+        proc.close()
+
+    def test_read_until_any_compiles_markers_once(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_interactive_channel([b"a> b> c> "])
+        transport.open_session.return_value = chan
+
+        _marker_pattern.cache_clear()
+        proc = RemoteProcess(ssh, "cmd")
+        for expected in (b"a", b"b", b"c"):
+            assert proc.read_until_any([b"> ", b"ERR: "]) == (expected, 0)
+        info = _marker_pattern.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+        proc.close()
+
+    def test_read_until_any_requires_markers(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        transport.open_session.return_value = make_interactive_channel([])
+
+        proc = RemoteProcess(ssh, "cmd")
+        with pytest.raises(ValueError, match="markers"):
+            proc.read_until_any([])
+        proc.close()
+
     def test_read_until_timeout(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = MagicMock()
         chan.status_event = threading.Event()
+        chan.fileno.return_value = idle_fileno()
         chan.closed = False
         chan.recv_ready = MagicMock(return_value=False)
         chan.recv_stderr_ready = MagicMock(return_value=False)
@@ -101,12 +205,11 @@ class TestRemoteProcess:
             proc.read_until(b"MARKER", timeout=0.1)
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_read_until_channel_closed(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = MagicMock()
         chan.status_event = threading.Event()
+        chan.fileno.return_value = idle_fileno()
         chan.status_event.set()
         chan.closed = False
         chan.recv_ready = MagicMock(return_value=False)
@@ -119,8 +222,6 @@ class TestRemoteProcess:
             proc.read_until(b"MARKER")
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_read_for(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([b"hello ", b"world"])
@@ -131,12 +232,11 @@ class TestRemoteProcess:
         assert result == b"hello world"
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_read_for_empty(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = MagicMock()
         chan.status_event = threading.Event()
+        chan.fileno.return_value = idle_fileno()
         chan.closed = False
         chan.recv_ready = MagicMock(return_value=False)
         chan.recv_stderr_ready = MagicMock(return_value=False)
@@ -148,8 +248,47 @@ class TestRemoteProcess:
         assert result == b""
         proc.close()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
+    def test_read_for_idle_blocks_instead_of_spinning(self, mock_connect, mock_transport_cls):
+        """An idle read_for() sleeps in select() between poll intervals."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = MagicMock()
+        chan.status_event = threading.Event()
+        chan.fileno.return_value = idle_fileno()
+        chan.closed = False
+        chan.recv_ready = MagicMock(return_value=False)
+        chan.recv_stderr_ready = MagicMock(return_value=False)
+        chan.exit_status_ready = MagicMock(return_value=False)
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_for(0.2) == b""
+        # 0.2s at a 50ms poll interval is ~4 wakeups; a busy loop would be thousands
+        assert chan.recv_ready.call_count <= 10
+        proc.close()
+
+    def test_read_until_after_eof_does_not_spin(self, mock_connect, mock_transport_cls):
+        """After EOF the fileno stays readable with no data; the wait must still sleep."""
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_eof_channel(b"partial")
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        with pytest.raises(SSHTimeoutError, match="partial"):
+            proc.read_until(b"MARKER", timeout=0.3)
+        # ~6 poll intervals; spinning on the readable fileno would be ~100k checks
+        assert chan.recv_ready.call_count <= 30
+        proc.close()
+
+    def test_read_for_after_eof_does_not_spin(self, mock_connect, mock_transport_cls):
+        ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
+        chan = make_eof_channel(b"tail")
+        transport.open_session.return_value = chan
+
+        proc = RemoteProcess(ssh, "cmd")
+        assert proc.read_for(0.3) == b"tail"
+        assert chan.recv_ready.call_count <= 30
+        proc.close()
+
     def test_alive_property(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([])
@@ -160,8 +299,6 @@ class TestRemoteProcess:
         proc.close()
         assert not proc.alive
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_context_manager(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([])
@@ -172,8 +309,6 @@ class TestRemoteProcess:
         assert not proc.alive
         chan.close.assert_called()
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_double_close(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([])
@@ -183,8 +318,6 @@ class TestRemoteProcess:
         proc.close()
         proc.close()  # should not raise
 
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_drains_stderr(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([b"dataMARKER"])
@@ -205,8 +338,6 @@ class TestRemoteProcess:
 
 
 class TestRemoteProcessFactory:
-    @patch("paramiko.Transport")
-    @patch("socket.create_connection")
     def test_returns_remote_process(self, mock_connect, mock_transport_cls):
         ssh, transport = connected_ssh(mock_connect, mock_transport_cls)
         chan = make_interactive_channel([])
@@ -188,6 +188,18 @@ class TestSSHClientConnect:
         mock_transport.set_keepalive.assert_called_once_with(30)
         mock_transport.auth_password.assert_called_once()
 
+    @patch("paramiko.Transport")
+    @patch("socket.create_connection")
+    def test_custom_keepalive_interval(self, mock_connect, mock_transport_cls):
+        mock_connect.return_value = MagicMock()
+        mock_transport = _make_mock_transport()
+        mock_transport_cls.return_value = mock_transport
+
+        ssh = SSHClient(SSHHop("host.example.com", auth_method="password", password="pw"), keepalive_interval=10)
+        ssh._ensure_connected()
+
+        mock_transport.set_keepalive.assert_called_once_with(10)
+
     @patch("paramiko.Transport")
     @patch("socket.create_connection")
     def test_multi_hop_chain(self, mock_connect, mock_transport_cls):
@@ -51,6 +51,20 @@ class TestDispatchAndIterate:
         results = [r.value for r, _ in handle.readings()]
         assert results == [10.0, 20.0, 30.0]
 
+    def test_dispatch_many_preserves_order(self, handle, make_reading):
+        handle._dispatch(make_reading(0.0))
+        handle._dispatch_many([make_reading(float(i)) for i in range(1, 5)])
+        handle._dispatch(make_reading(5.0))
+        handle._signal_stop()
+
+        results = [r.value for r, _ in handle.readings()]
+        assert results == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_dispatch_many_after_stop_is_noop(self, handle, make_reading):
+        handle._signal_stop()
+        handle._dispatch_many([make_reading(1.0), make_reading(2.0)])
+        assert list(handle.readings()) == []
+
     def test_dispatch_after_stop_is_noop(self, handle, make_reading):
         """Dispatch after stop silently discards the reading."""
         handle._signal_stop()
@@ -121,6 +135,17 @@ class TestBufferOverflow:
         results = [r.value for r, _ in handle.readings()]
         assert results == [0.0, 1.0, 2.0]
 
+    def test_dispatch_many_overflow_drops_newest(self, handle, make_reading, caplog):
+        handle._maxsize = 3
+        handle._dispatch(make_reading(0.0))
+        with caplog.at_level(logging.WARNING, logger="pacsys.backends._subscription"):
+            handle._dispatch_many([make_reading(float(i)) for i in range(1, 5)])
+            handle._dispatch_many([make_reading(9.0)])
+        handle._signal_stop()
+
+        assert [r.value for r, _ in handle.readings()] == [0.0, 1.0, 2.0]
+        assert "dropped 2 readings" in caplog.text
+
     def test_overflow_drop_logging_throttled(self, handle, make_reading, caplog):
         """Drop warnings are throttled to once per 5s window."""
         handle._maxsize = 1
@@ -133,6 +158,26 @@ class TestBufferOverflow:
         warnings = [r for r in caplog.records if "buffer full" in r.message.lower()]
         assert len(warnings) == 1
 
+    def test_overflow_drop_logging_window_reopens(self, handle, make_reading, caplog, monkeypatch):
+        """After 5s a new warning reports the drops accumulated in the window."""
+        import pacsys.backends._subscription as sub_mod
+
+        now = [10_000_000_000]
+        monkeypatch.setattr(sub_mod.time, "monotonic_ns", lambda: now[0])
+        handle._maxsize = 1
+        handle._dispatch(make_reading(0.0))
+
+        with caplog.at_level(logging.WARNING, logger="pacsys.backends._subscription"):
+            handle._dispatch(make_reading(1.0))  # logs "dropped 1"
+            now[0] += 4_999_999_999
+            handle._dispatch(make_reading(2.0))  # throttled
+            now[0] += 1
+            handle._dispatch(make_reading(3.0))  # logs "dropped 2"
+
+        warnings = [r.getMessage() for r in caplog.records if "buffer full" in r.message.lower()]
+        assert len(warnings) == 2
+        assert warnings[1].endswith("dropped 2 readings")
+
 
 # =============================================================================
 # Timeout behavior
@@ -251,6 +296,36 @@ class TestConcurrency:
         assert not consumer.is_alive()
         assert results == [float(i) for i in range(n)]
 
+    def test_no_lost_wakeups_under_burst(self, handle, make_reading):
+        """Lock-free producers never strand a reading while the consumer waits."""
+        n = 2000
+        results = []
+
+        def consume():
+            for reading, _ in handle.readings(timeout=10.0):
+                results.append(reading.value)
+
+        def produce(offset):
+            for i in range(n):
+                handle._dispatch(make_reading(float(offset + i)))
+                if i % 100 == 0:
+                    time.sleep(0.001)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        producers = [threading.Thread(target=produce, args=(k * n,)) for k in range(2)]
+        for t in producers:
+            t.start()
+        for t in producers:
+            t.join()
+        handle._signal_stop()
+
+        consumer.join(timeout=10.0)
+        assert not consumer.is_alive()
+        assert sorted(results) == [float(i) for i in range(2 * n)]
+        # Per-producer order is preserved
+        assert [v for v in results if v < n] == [float(i) for i in range(n)]
+
     def test_data_arriving_during_wait(self, handle, make_reading):
         """Reader blocked on empty buffer receives data when dispatched."""
         results = []